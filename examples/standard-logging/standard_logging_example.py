@@ -52,12 +52,13 @@ def main():
     # Log messages at different levels in a loop
     try:
         for i in range(60):  # Run for 60 seconds
-            logger.debug(f"[{i}] Debug message - only visible when level is DEBUG")
-            logger.info(f"[{i}] Info message - visible when level is INFO or below")
+            # %-style args are only formatted if the record passes the filter
+            logger.debug("[%d] Debug message - only visible when level is DEBUG", i)
+            logger.info("[%d] Info message - visible when level is INFO or below", i)
             logger.warning(
-                f"[{i}] Warning message - visible when level is WARN or below"
+                "[%d] Warning message - visible when level is WARN or below", i
             )
-            logger.error(f"[{i}] Error message - visible when level is ERROR or below")
+            logger.error("[%d] Error message - visible when level is ERROR or below", i)
             time.sleep(1)
     except KeyboardInterrupt:
         print("\nShutting down...")
@@ -54,7 +54,7 @@ from prefab_pb2 import (
 
 # Note: LogLevel is imported from .log_level, not from prefab_pb2
 
-log = _internal_logging.InternalLogger(__name__)
+log = _internal_logging.get_internal_logger(__name__)
 
 
 __version_cache: Optional[str] = None
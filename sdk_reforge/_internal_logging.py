@@ -1,97 +1,101 @@
-import threading
 import logging
+from collections import ChainMap
+from contextvars import ContextVar, Token
+from types import MappingProxyType, SimpleNamespace
 from typing import Iterator
 
 import prefab_pb2 as Prefab
 
-
 LLV = Prefab.LogLevel.Value
 
+# Shared, read-only extra used to tag every record emitted by InternalLogger
+_INTERNAL_EXTRA = MappingProxyType({"prefab_internal": True})
+
+
+# Protobuf LogLevel ints, e.g. LOG_LEVELS.DEBUG. The enum values are fixed in
+# prefab.proto and never renumbered, so resolving them once at import is safe
+# and saves an EnumTypeWrapper.Value() call on every lookup.
+LOG_LEVELS = SimpleNamespace(
+    **{name: LLV(name) for name in ("TRACE", "DEBUG", "INFO", "WARN", "ERROR", "FATAL")}
+)
 
 python_log_level_name_to_prefab_log_levels = {
-    "debug": LLV("DEBUG"),
-    "info": LLV("INFO"),
-    "warn": LLV("WARN"),
-    "warning": LLV("WARN"),
-    "error": LLV("ERROR"),
-    "critical": LLV("FATAL"),
+    "debug": LOG_LEVELS.DEBUG,
+    "info": LOG_LEVELS.INFO,
+    "warn": LOG_LEVELS.WARN,
+    "warning": LOG_LEVELS.WARN,
+    "error": LOG_LEVELS.ERROR,
+    "critical": LOG_LEVELS.FATAL,
 }
 
 python_to_prefab_log_levels = {
-    logging.NOTSET: LLV("DEBUG"),
-    logging.DEBUG: LLV("DEBUG"),
-    logging.INFO: LLV("INFO"),
-    logging.WARN: LLV("WARN"),
-    logging.ERROR: LLV("ERROR"),
-    logging.CRITICAL: LLV("FATAL"),
+    logging.NOTSET: LOG_LEVELS.DEBUG,
+    logging.DEBUG: LOG_LEVELS.DEBUG,
+    logging.INFO: LOG_LEVELS.INFO,
+    logging.WARN: LOG_LEVELS.WARN,
+    logging.ERROR: LOG_LEVELS.ERROR,
+    logging.CRITICAL: LOG_LEVELS.FATAL,
 }
 
 prefab_to_python_log_levels = {
-    LLV("TRACE"): logging.DEBUG,
-    LLV("DEBUG"): logging.DEBUG,
-    LLV("INFO"): logging.INFO,
-    LLV("WARN"): logging.WARN,
-    LLV("ERROR"): logging.ERROR,
-    LLV("FATAL"): logging.CRITICAL,
+    LOG_LEVELS.TRACE: logging.DEBUG,
+    LOG_LEVELS.DEBUG: logging.DEBUG,
+    LOG_LEVELS.INFO: logging.INFO,
+    LOG_LEVELS.WARN: logging.WARN,
+    LOG_LEVELS.ERROR: logging.ERROR,
+    LOG_LEVELS.FATAL: logging.CRITICAL,
 }
 
 
 def iterate_dotted_string(s: str) -> Iterator[str]:
-    parts = s.split(".")
-    for i in range(len(parts), 0, -1):
-        yield ".".join(parts[:i])
+    # Yields "a.b.c", "a.b", "a" by slicing the original string
+    yield s
+    i = s.rfind(".")
+    while i > 0:
+        yield s[:i]
+        i = s.rfind(".", 0, i)
 
 
-class ReentrancyCheck:
-    thread_local = threading.local()
+# Nesting depth of reentrancy guards in the current thread/task; > 0 means set
+_reentrant: ContextVar[int] = ContextVar("prefab_log_reentrant", default=0)
+
 
+class ReentrancyCheck:
     @staticmethod
-    def set() -> None:
-        ReentrancyCheck.thread_local.prefab_log_reentrant = True
+    def set() -> Token[int]:
+        return _reentrant.set(_reentrant.get() + 1)
 
     @staticmethod
     def is_set() -> bool:
-        # Safely check if the thread-local variable is set and return True/False
-        return getattr(ReentrancyCheck.thread_local, "prefab_log_reentrant", False)
+        return _reentrant.get() > 0
 
     @staticmethod
-    def clear() -> None:
-        try:
-            # Attempt to delete the variable
-            delattr(ReentrancyCheck.thread_local, "prefab_log_reentrant")
-        except AttributeError:
-            # Variable was not set for this thread
-            pass
+    def clear(token: Token[int]) -> None:
+        # Restore the value from before the matching set()
+        _reentrant.reset(token)
+
+
+class _Reentrant:
+    """
+    Context manager form of ReentrancyCheck. Entering and exiting just step the
+    depth counter, so the shared REENTRANT instance keeps no per-use state and
+    can guard nested blocks on any thread.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        _reentrant.set(_reentrant.get() + 1)
+
+    def __exit__(self, *exc_info: object) -> None:
+        _reentrant.set(_reentrant.get() - 1)
+
+
+REENTRANT = _Reentrant()
 
 
 class InternalLogger(logging.Logger):
-    def __init__(self, name: str, level: int = logging.NOTSET) -> None:
-        super().__init__(name, level)
-        self.thread_local = threading.local()
-
-        # Register this logger with the logging manager so it can participate
-        # in the logger hierarchy and inherit handlers from parent loggers
-        logging.Logger.manager.loggerDict[name] = self
-
-        # Set up the parent logger in the hierarchy
-        # This is adapted from logging.Logger.manager._fixupParents
-        i = name.rfind(".")
-        rv = None
-        while (i > 0) and not rv:
-            substr = name[:i]
-            if substr not in logging.Logger.manager.loggerDict:
-                logging.Logger.manager.loggerDict[substr] = logging.PlaceHolder(self)
-            else:
-                obj = logging.Logger.manager.loggerDict[substr]
-                if isinstance(obj, logging.Logger):
-                    rv = obj
-                else:
-                    # It's a PlaceHolder
-                    obj.append(self)
-            i = name.rfind(".", 0, i - 1)
-        if not rv:
-            rv = logging.root
-        self.parent = rv
+    """Logger used inside the SDK; obtain instances via get_internal_logger()."""
 
     def _log(
         self,
@@ -109,11 +113,10 @@ class InternalLogger(logging.Logger):
         """
         if not ReentrancyCheck.is_set():
             if extra is None:
-                extra = {}
+                extra = _INTERNAL_EXTRA
             else:
-                # Make a copy to avoid modifying the caller's dict
-                extra = extra.copy()
-            extra["prefab_internal"] = True
+                # Layer the marker over the caller's dict rather than copying it
+                extra = ChainMap(_INTERNAL_EXTRA, extra)
 
             super()._log(
                 level,
@@ -124,3 +127,16 @@ class InternalLogger(logging.Logger):
                 stack_info=stack_info,
                 stacklevel=stacklevel,
             )
+
+
+def get_internal_logger(name: str) -> InternalLogger:
+    """
+    Return the logger registered under name, converted to an InternalLogger.
+
+    logging.getLogger handles registration with the manager and hooking the
+    logger into the parent/child hierarchy, so only the class needs swapping.
+    """
+    lg = logging.getLogger(name)
+    if not isinstance(lg, InternalLogger):
+        lg.__class__ = InternalLogger
+    return lg  # type: ignore[return-value]
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 import time
 
 from ._internal_logging import (
-    InternalLogger,
+    get_internal_logger,
 )
 import requests
 from requests import Response, RequestException
@@ -18,7 +18,7 @@ from tenacity import (
 
 import os
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 def _get_version():
@@ -37,6 +37,8 @@ VersionHeader = "X-Reforge-SDK-Version"
 
 DEFAULT_TIMEOUT = 5  # seconds
 
+DEFAULT_POOL_SIZE = 4  # connections kept alive per host
+
 
 # from https://findwork.dev/blog/advanced-usage-python-requests-timeouts-retries-hooks/
 class TimeoutHTTPAdapter(HTTPAdapter):
@@ -125,11 +127,16 @@ class ApiClient:
         :param options: An object with attributes such as:
             - prefab_api_urls: list of API host URLs (e.g. ["https://a.example.com", "https://b.example.com"])
             - version: version string
+            - http_pool_size: keep-alive connections to retain per host
         """
         self.hosts = options.reforge_api_urls
         self.session = requests.Session()
-        self.session.mount("https://", requests.adapters.HTTPAdapter())
-        self.session.mount("http://", requests.adapters.HTTPAdapter())
+        # One adapter (and so one connection pool manager) shared by checkpoint
+        # polls and the SSE stream, so fallback polls reuse warm TLS connections
+        pool_size = getattr(options, "http_pool_size", DEFAULT_POOL_SIZE)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {VersionHeader: f"sdk-python-{getattr(options, 'version', 'development')}"}
         )
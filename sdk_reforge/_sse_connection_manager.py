@@ -6,7 +6,7 @@ import sseclient  # type: ignore
 from requests import Response
 from requests.exceptions import HTTPError
 
-from sdk_reforge._internal_logging import InternalLogger
+from sdk_reforge._internal_logging import get_internal_logger
 from sdk_reforge._requests import ApiClient
 from sdk_reforge._sse_watchdog import WatchdogResponseWrapper
 import prefab_pb2 as Prefab
@@ -25,7 +25,7 @@ class TooQuickConnectionException(Exception):
     pass
 
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 class SSEConnectionManager:
@@ -80,9 +80,7 @@ class SSEConnectionManager:
                             backoff_time = MIN_BACKOFF_TIME
                         time.sleep(backoff_time)
                 except TooQuickConnectionException as e:
-                    logger.debug(
-                        f"Connection ended quickly: {str(e)}. Will apply backoff."
-                    )
+                    logger.debug("Connection ended quickly: %s. Will apply backoff.", e)
                     backoff_time = min(backoff_time * 2, MAX_BACKOFF_TIME)
                     time.sleep(backoff_time)
                 except HTTPError as e:
@@ -1,16 +1,27 @@
+import heapq
+import io
+import itertools
+import os
 import threading
 import time
-from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
+from functools import partial
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
-from ._internal_logging import InternalLogger
+from ._internal_logging import get_internal_logger
 
 if TYPE_CHECKING:
     from .config_sdk_interface import ConfigSDKInterface
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
-DEFAULT_CHECK_INTERVAL: float = 60  # seconds
 DEFAULT_MAX_SILENCE: float = 120  # seconds (4 missed 30s keepalives)
+# By default sleep straight to the silence deadline rather than polling sooner
+DEFAULT_CHECK_INTERVAL: float = DEFAULT_MAX_SILENCE  # seconds
+MIN_WAIT: float = 1  # seconds, floor for waits computed from the silence deadline
+DEFAULT_COALESCE_NS: int = (
+    1_000_000_000  # min ns between activity updates from the stream
+)
+READ_SIZE: int = 8192  # max bytes per read from the raw SSE stream
 
 
 class WatchdogResponseWrapper:
@@ -18,36 +29,155 @@ class WatchdogResponseWrapper:
 
     This allows the watchdog to track when ANY data is received from the SSE
     connection, including keepalive comments that sseclient filters out.
+
+    The callback is invoked at most once per coalesce_ns nanoseconds; the
+    watchdog only needs to know about activity at a much coarser resolution
+    than individual chunks.
     """
 
-    def __init__(self, response: Any, on_data_received: Callable[[], None]) -> None:
+    def __init__(
+        self,
+        response: Any,
+        on_data_received: Callable[[], None],
+        coalesce_ns: int = DEFAULT_COALESCE_NS,
+    ) -> None:
         self._response = response
         self._on_data_received = on_data_received
+        self._coalesce_ns = coalesce_ns
+        # Start one window in the past so the first chunk always calls back
+        self._last_cb_ns = time.monotonic_ns() - coalesce_ns
 
     def __iter__(self) -> Iterator[Any]:
-        for chunk in self._response:
-            self._on_data_received()
+        for chunk in self._chunks():
+            now = time.monotonic_ns()
+            if now - self._last_cb_ns >= self._coalesce_ns:
+                self._on_data_received()
+                self._last_cb_ns = now
             yield chunk
 
+    def _chunks(self) -> Iterator[Any]:
+        # Iterating a requests Response yields fixed 128-byte pieces. When the
+        # response was made with stream=True its urllib3 body supports read1(),
+        # which hands back whatever has arrived (up to READ_SIZE) in one call.
+        raw = getattr(self._response, "raw", None)
+        if isinstance(raw, io.IOBase) and hasattr(raw, "read1"):
+            return iter(partial(raw.read1, READ_SIZE, decode_content=True), b"")
+        return iter(self._response)
+
     def close(self) -> None:
         self._response.close()
 
 
+class _WatchdogScheduler:
+    """Runs the checks of every started SSEWatchdog from one shared thread.
+
+    Entries are kept in a heap ordered by deadline. The thread is started on
+    the first registration and exits once nothing is left to schedule, so
+    any number of SDK instances cost at most one extra thread.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[float, int, "SSEWatchdog"]] = []
+        self._seq = itertools.count()  # tie-breaker so watchdogs are never compared
+        self._thread: Optional[threading.Thread] = None
+
+    def _reset_after_fork(self) -> None:
+        """Drop state inherited in forked children.
+
+        The parent's thread doesn't exist in the child and the condition may
+        have been held at the moment of the fork, so start over empty.
+        """
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+        self._thread = None
+
+    def __contains__(self, watchdog: object) -> bool:
+        with self._cond:
+            return any(entry[2] is watchdog for entry in self._queue)
+
+    def add(self, watchdog: "SSEWatchdog", delay: float) -> None:
+        """Schedule a check of watchdog in delay seconds."""
+        with self._cond:
+            self._push(watchdog, delay)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sse-watchdog", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def remove(self, watchdog: "SSEWatchdog") -> None:
+        """Drop any pending check of watchdog."""
+        with self._cond:
+            self._queue = [entry for entry in self._queue if entry[2] is not watchdog]
+            heapq.heapify(self._queue)
+            self._cond.notify()
+
+    def _push(self, watchdog: "SSEWatchdog", delay: float) -> None:
+        heapq.heappush(
+            self._queue, (time.monotonic() + delay, next(self._seq), watchdog)
+        )
+
+    def _run(self) -> None:
+        while True:
+            watchdog = self._next_due()
+            if watchdog is None:
+                return
+            try:
+                delay = watchdog._check()
+            except Exception as e:
+                logger.warning(f"SSE watchdog check failed, stopping watchdog: {e}")
+                delay = None
+            with self._cond:
+                # stop() may have run during the check; it sets the flag before
+                # removing entries, so checking it under the lock is enough
+                if delay is not None and not watchdog._stop.is_set():
+                    self._push(watchdog, delay)
+
+    def _next_due(self) -> Optional["SSEWatchdog"]:
+        """Block until the earliest check is due and pop it; None once idle."""
+        with self._cond:
+            while self._queue:
+                deadline, _, watchdog = self._queue[0]
+                delay = deadline - time.monotonic()
+                if delay <= 0:
+                    heapq.heappop(self._queue)
+                    return watchdog
+                self._cond.wait(delay)
+            self._thread = None
+            return None
+
+
+_SCHEDULER = _WatchdogScheduler()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SCHEDULER._reset_after_fork)
+
+
 class SSEWatchdog:
     """Monitors SSE connection health and triggers recovery when stuck.
 
-    The watchdog runs in a separate thread and periodically checks if SSE data
-    has been received recently. If no data (including keepalives) has been
+    Checks run on a thread shared by all watchdogs in the process. Each check is
+    scheduled for the earliest moment the connection could have been silent for
+    max_silence seconds; touch() only ever moves that deadline later, so it
+    never needs to reschedule. If no data (including keepalives) has been
     received for max_silence seconds, it:
     1. Logs a warning
-    2. Polls the checkpoint API to get fresh config data
+    2. Polls the checkpoint API for configs newer than the current highwater mark
     3. Closes the SSE connection to force reconnection
+
+    Steps 2 and 3 run concurrently on their own daemon threads and the check
+    doesn't wait for them, so a stalled poll or socket close can't hold up the
+    shared scheduler thread or process exit. A new recovery is skipped while
+    the previous one is still running.
     """
 
     def __init__(
         self,
         config_client: "ConfigSDKInterface",
-        poll_fallback_fn: Callable[[], None],
+        poll_fallback_fn: Callable[[int], None],
         get_sse_client_fn: Callable[[], Any],
         check_interval: float = DEFAULT_CHECK_INTERVAL,
         max_silence: float = DEFAULT_MAX_SILENCE,
@@ -56,9 +186,10 @@ class SSEWatchdog:
 
         Args:
             config_client: The config client interface for checking shutdown state
-            poll_fallback_fn: Function to call to poll for fresh config data
+            poll_fallback_fn: Function to call to poll for configs newer than the
+                given highwater mark
             get_sse_client_fn: Function that returns the current SSE client (or None)
-            check_interval: How often to check for silence (seconds)
+            check_interval: Longest the loop sleeps between checks (seconds)
             max_silence: Trigger recovery after this many seconds of no data
         """
         self.config_client = config_client
@@ -66,35 +197,44 @@ class SSEWatchdog:
         self.get_sse_client_fn = get_sse_client_fn
         self.check_interval = check_interval
         self.max_silence = max_silence
-        self.last_activity = time.time()
+        # Monotonic so wall-clock adjustments can't fake (or hide) a silence.
+        # touch() is a single int store and the check only reads it, so no
+        # lock is needed.
+        self.last_activity_ns = time.monotonic_ns()
         self._stop = threading.Event()
-        self._thread: Optional[threading.Thread] = None
+        self._recovery_threads: List[threading.Thread] = []
 
     def touch(self) -> None:
         """Called when any SSE data is received (including keepalives)."""
-        self.last_activity = time.time()
+        self.last_activity_ns = time.monotonic_ns()
 
     def start(self) -> None:
-        """Start the watchdog thread."""
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        """Register the watchdog with the shared scheduler."""
+        _SCHEDULER.add(self, self._next_wait())
 
     def stop(self) -> None:
-        """Stop the watchdog thread."""
+        """Unregister the watchdog; no further checks will run."""
         self._stop.set()
-        thread = self._thread
-        if thread and thread.is_alive():
-            thread.join(timeout=5)
+        _SCHEDULER.remove(self)
 
-    def _run(self) -> None:
-        """Main watchdog loop."""
-        while not self._stop.wait(self.check_interval):
-            if self.config_client.is_shutting_down():
-                break
+    def _check(self) -> Optional[float]:
+        """Run one check; returns the delay until the next one, or None to stop."""
+        if self._stop.is_set() or self.config_client.is_shutting_down():
+            return None
+
+        silence = self._silence()
+        if silence > self.max_silence:
+            self._trigger_recovery(silence)
+        return self._next_wait()
+
+    def _next_wait(self) -> float:
+        """Sleep until the next check is due, or until the silence deadline if sooner."""
+        remaining = self.max_silence - self._silence()
+        return min(self.check_interval, max(remaining, MIN_WAIT))
 
-            silence = time.time() - self.last_activity
-            if silence > self.max_silence:
-                self._trigger_recovery(silence)
+    def _silence(self) -> float:
+        """Seconds since the last activity."""
+        return (time.monotonic_ns() - self.last_activity_ns) / 1e9
 
     def _trigger_recovery(self, silence: float) -> None:
         """Trigger recovery actions when SSE appears stuck."""
@@ -103,14 +243,32 @@ class SSEWatchdog:
             "triggering recovery"
         )
 
-        # 1. Poll for fresh data immediately
+        # Reset activity timer so the next check is a full max_silence away
+        self.last_activity_ns = time.monotonic_ns()
+
+        if self._stop.is_set():
+            return  # stop() ran while this check was running
+        if any(thread.is_alive() for thread in self._recovery_threads):
+            logger.warning("Previous SSE recovery still running, skipping this one")
+            return
+
+        self._recovery_threads = [
+            threading.Thread(target=target, name="sse-recovery", daemon=True)
+            for target in (self._poll_fallback, self._close_sse)
+        ]
+        for thread in self._recovery_threads:
+            thread.start()
+
+    def _poll_fallback(self) -> None:
+        """Poll for anything newer than what we already have."""
         try:
-            self.poll_fallback_fn()
+            self.poll_fallback_fn(self.config_client.highwater_mark())
             logger.info("Fallback poll completed successfully")
         except Exception as e:
             logger.warning(f"Fallback poll failed: {e}")
 
-        # 2. Force SSE reconnection by closing current connection
+    def _close_sse(self) -> None:
+        """Force SSE reconnection by closing the current connection."""
         try:
             sse_client = self.get_sse_client_fn()
             if sse_client:
@@ -118,6 +276,3 @@ class SSEWatchdog:
                 logger.debug("Closed SSE client to force reconnection")
         except Exception:
             pass  # Best effort
-
-        # Reset activity timer after recovery attempt
-        self.last_activity = time.time()
@@ -21,9 +21,9 @@ from .config_resolver import Evaluation
 from collections import defaultdict
 
 from .context_shape_aggregator import ContextShapeAggregator
-from ._internal_logging import InternalLogger
+from ._internal_logging import get_internal_logger
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 def current_time_millis() -> int:
@@ -1,7 +1,7 @@
 import prefab_pb2 as Prefab
-from ._internal_logging import InternalLogger
+from ._internal_logging import get_internal_logger
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 class ConfigLoader:
@@ -26,8 +26,11 @@ class ConfigLoader:
         else:
             if existing_config:
                 logger.debug(
-                    "Replace %s with value from %s %s -> %s"
-                    % (config.key, source, existing_config["config"].id, config.id),
+                    "Replace %s with value from %s %s -> %s",
+                    config.key,
+                    source,
+                    existing_config["config"].id,
+                    config.id,
                 )
             self.api_config[config.key] = {"source": source, "config": config}
         self.highwater_mark = max([config.id, self.highwater_mark])
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from .read_write_lock import ReadWriteLock
 from .config_value_unwrapper import ConfigValueUnwrapper
 from .context import Context
-from ._internal_logging import InternalLogger
+from ._internal_logging import get_internal_logger
 from .simple_criterion_evaluators import (
     NumericOperators,
     StringOperators,
@@ -16,7 +16,7 @@ from .simple_criterion_evaluators import (
 )
 import prefab_pb2 as Prefab
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 class ConfigResolver:
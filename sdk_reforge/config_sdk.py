@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 
-from ._internal_logging import InternalLogger
+from ._internal_logging import get_internal_logger
+import itertools
 import threading
 import time
 from typing import Optional
@@ -25,7 +26,7 @@ from google.protobuf.json_format import MessageToJson, Parse
 
 STALE_CACHE_WARN_HOURS = 5
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 class InitializationTimeoutException(Exception):
@@ -58,6 +59,10 @@ class ConfigSDK(ConfigSDKInterface):
         self.checkpoint_freq_secs = 60
         self.config_loader = ConfigLoader(base_client)
         self.config_resolver = ConfigResolver(base_client, self.config_loader)
+        # next() on itertools.count is atomic, so concurrent loads from the SSE
+        # and polling threads always produce distinct generations
+        self._generation_counter = itertools.count(1)
+        self._config_generation = 0
         self._cache_path = None
         self.set_cache_path()
         self.api_client = ApiClient(self.options)
@@ -86,12 +91,21 @@ class ConfigSDK(ConfigSDKInterface):
         default=NoDefaultProvided,
         context: Optional[dict | Context] = None,
     ) -> ConfigValueType:
+        evaluation_result = self.get_evaluation(key, context=context)
+        if evaluation_result is not None and evaluation_result.config:
+            return evaluation_result.unwrapped_value()
+        return self.handle_default(key, default)
+
+    def get_evaluation(
+        self,
+        key,
+        context: Optional[dict | Context] = None,
+    ) -> None | Evaluation:
+        """Evaluate key and record the evaluation for telemetry."""
         evaluation_result = self.__get(key, None, {}, context=context)
         if evaluation_result is not None:
             self.base_client.telemetry_manager.record_evaluation(evaluation_result)
-            if evaluation_result.config:
-                return evaluation_result.unwrapped_value()
-        return self.handle_default(key, default)
+        return evaluation_result
 
     def __get(
         self,
@@ -161,13 +175,13 @@ class ConfigSDK(ConfigSDKInterface):
         if self.watchdog:
             self.watchdog.start()
 
-    def _watchdog_poll_fallback(self) -> None:
+    def _watchdog_poll_fallback(self, highwater_mark: int) -> None:
         """Called by watchdog when SSE connection appears stuck.
 
-        Polls the checkpoint API to get fresh config data.
+        Polls the checkpoint API for configs newer than highwater_mark.
         """
         logger.info("Watchdog triggered poll fallback")
-        self.load_checkpoint_from_api_cdn()
+        self.load_checkpoint_from_api_cdn(highwater_mark, source="watchdog_poll")
 
     def is_shutting_down(self):
         return self.base_client.shutdown_flag.is_set()
@@ -178,15 +192,25 @@ class ConfigSDK(ConfigSDKInterface):
     def highwater_mark(self) -> int:
         return self.config_loader.highwater_mark
 
+    def config_generation(self) -> int:
+        return self._config_generation
+
     def load_initial_data(self):
         try:
             self.load_checkpoint()
         except UnauthorizedException:
             self.handle_unauthorized_response()
 
-    def load_checkpoint_from_api_cdn(self):
+    def load_checkpoint_from_api_cdn(
+        self, highwater_mark: Optional[int] = None, source: str = "remote_api_cdn"
+    ):
         try:
-            hwm = self.config_loader.highwater_mark
+            # The checkpoint endpoint only returns configs newer than this id
+            hwm = (
+                self.config_loader.highwater_mark
+                if highwater_mark is None
+                else highwater_mark
+            )
             response = self.api_client.resilient_request(
                 "/api/v2/configs/" + str(hwm),
                 auth=("authuser", self.options.api_key),
@@ -200,7 +224,7 @@ class ConfigSDK(ConfigSDKInterface):
                     )
                     return False
                 configs = Prefab.Configs.FromString(response.content)
-                self.load_configs(configs, "remote_api_cdn")
+                self.load_configs(configs, source)
                 return True
             else:
                 logger.info(
@@ -234,9 +258,12 @@ class ConfigSDK(ConfigSDKInterface):
             )
         else:
             logger.debug(
-                f"Checkpoint with highwater id {self.config_loader.highwater_mark} from {source}. No changes.",
+                "Checkpoint with highwater id %s from %s. No changes.",
+                self.config_loader.highwater_mark,
+                source,
             )
         self.config_resolver.update()
+        self._config_generation = next(self._generation_counter)
         self.finish_init(source)
 
     def cache_configs(self, configs):
@@ -246,7 +273,7 @@ class ConfigSDK(ConfigSDKInterface):
             return
         with open(self.cache_path, "w") as f:
             f.write(MessageToJson(configs))
-            logger.debug(f"Cached configs to {self.cache_path}")
+            logger.debug("Cached configs to %s", self.cache_path)
 
     def load_cache(self):
         if not self.options.use_local_cache:
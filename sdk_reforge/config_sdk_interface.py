@@ -12,6 +12,11 @@ class ConfigSDKInterface(ABC):
     def highwater_mark(self) -> int:
         pass
 
+    @abstractmethod
+    def config_generation(self) -> int:
+        """Counter that changes every time configs are (re)loaded."""
+        pass
+
     @abstractmethod
     def handle_unauthorized_response(self) -> None:
         pass
@@ -17,13 +17,13 @@ import yaml
 import os
 import hashlib
 import isodate
-from ._internal_logging import InternalLogger
+from ._internal_logging import get_internal_logger
 
 VTV = Prefab.Config.ValueType.Value
 VTN = Prefab.Config.ValueType.Name
 CONFIDENTIAL_PREFIX = "*****"
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 class EnvVarParseException(Exception):
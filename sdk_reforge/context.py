@@ -19,6 +19,8 @@ class InvalidContextFormatException(Exception):
 class Context:
     def __init__(self, context={}) -> None:
         self.contexts = {}
+        # Bumped by set/merge/clear so callers can spot in-place changes
+        self.generation = 0
 
         if isinstance(context, NamedContext):
             self.contexts[context.name] = context
@@ -45,6 +47,7 @@ class Context:
 
     def set(self, key, value):
         self.contexts[str(key)] = NamedContext(key, value)
+        self.generation += 1
 
     def get(self, property_key):
         name_and_key = property_key.split(".", maxsplit=1)
@@ -60,6 +63,7 @@ class Context:
 
     def merge(self, key, value):
         self.contexts[str(key)] = NamedContext(key, data=value)
+        self.generation += 1
 
     def merge_context_dict(self, context):
         for name, nested_context in context.items():
@@ -69,6 +73,7 @@ class Context:
 
     def clear(self):
         self.contexts = {}
+        self.generation += 1
 
     def to_dict(self):
         d = {}
@@ -90,12 +95,11 @@ class Context:
 
     @staticmethod
     def get_current():
-        if (
-            "prefab_context" not in dir(current_thread())
-            or current_thread().prefab_context is None
-        ):
-            Context.set_current(Context())
-        return current_thread().prefab_context
+        context = getattr(current_thread(), "prefab_context", None)
+        if context is None:
+            context = Context()
+            Context.set_current(context)
+        return context
 
     @staticmethod
     def merge_with_current(new_context_attributes):
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from typing import Optional
 
+from .config_resolver import Evaluation
 from .context import Context
 from .constants import NoDefaultProvided, ConfigValueType
-from ._internal_logging import InternalLogger
+from ._internal_logging import get_internal_logger
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 class FeatureFlagSDK:
@@ -43,6 +44,13 @@ class FeatureFlagSDK:
             feature_name, default=default, context=context
         )
 
+    def get_evaluation(
+        self, feature_name, context: Optional[dict | Context] = None
+    ) -> None | Evaluation:
+        return self.base_client.config_sdk().get_evaluation(
+            feature_name, context=context
+        )
+
     def _is_on(self, variant) -> bool:
         try:
             if variant is None:
@@ -6,7 +6,9 @@ adjust log levels based on Reforge configuration.
 """
 
 import logging
-from typing import Optional, Any
+from typing import Any
+from typing import Optional
+from typing import Tuple
 
 try:
     from structlog import DropEvent
@@ -16,8 +18,65 @@ except ImportError:
     STRUCTLOG_AVAILABLE = False
     DropEvent = None
 
+import prefab_pb2 as Prefab
 import sdk_reforge
 from sdk_reforge import ReforgeSDK
+from sdk_reforge._internal_logging import ReentrancyCheck
+from sdk_reforge.config_resolver import ConfigResolver
+from sdk_reforge.config_resolver import Evaluation
+from sdk_reforge.context import Context
+from sdk_reforge.log_level import LogLevel
+
+# Most distinct logger names whose levels are remembered; the cache is simply
+# emptied when it fills up
+LEVEL_CACHE_SIZE = 1024
+
+_CURRENT_TIME_PROPERTIES = frozenset(("prefab.current-time", "reforge.current-time"))
+_SEGMENT_OPERATORS = frozenset(
+    (
+        Prefab.Criterion.CriterionOperator.IN_SEG,
+        Prefab.Criterion.CriterionOperator.NOT_IN_SEG,
+    )
+)
+
+_LevelCacheEntry = Tuple[ReforgeSDK, int, Context, int, LogLevel]
+
+# structlog method/level names mapped straight to stdlib numeric levels, so the
+# common case is a single dict hit instead of str.upper() + getLevelName()
+_STRUCTLOG_LEVEL_NUMBERS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+
+
+def _reads_current_time(
+    config: Prefab.Config, resolver: ConfigResolver, seen: frozenset = frozenset()
+) -> bool:
+    """
+    Whether any rule in config, or in a segment it references, matches on the
+    current time; such a config can change its answer without being reloaded.
+    """
+    seen = seen | {config.key}
+    for row in config.rows:
+        for conditional_value in row.values:
+            for criterion in conditional_value.criteria:
+                if criterion.property_name in _CURRENT_TIME_PROPERTIES:
+                    return True
+                if criterion.operator in _SEGMENT_OPERATORS:
+                    segment = resolver.raw(criterion.value_to_match.string)
+                    if (
+                        segment is not None
+                        and segment.key not in seen
+                        and _reads_current_time(segment, resolver, seen)
+                    ):
+                        return True
+    return False
 
 
 class BaseLoggerFilterProcessor:
@@ -25,6 +84,9 @@ class BaseLoggerFilterProcessor:
 
     def __init__(self, sdk: Optional[ReforgeSDK] = None) -> None:
         self.sdk = sdk
+        # logger name -> (sdk, config generation, global context, global
+        # context generation, level)
+        self._level_cache: dict[str, _LevelCacheEntry] = {}
 
     def _get_sdk(self) -> Optional[ReforgeSDK]:
         """Get SDK instance, either from constructor or singleton"""
@@ -39,9 +101,67 @@ class BaseLoggerFilterProcessor:
         self, sdk: ReforgeSDK, logger_name: str, called_method_level: int
     ) -> bool:
         """Check if message should be logged based on configured level"""
-        log_level = sdk.get_log_level(logger_name)
+        log_level = self._get_log_level(sdk, logger_name)
         return called_method_level >= log_level.python_level
 
+    def _get_log_level(self, sdk: ReforgeSDK, logger_name: str) -> LogLevel:
+        """
+        Get the configured level for a logger, reusing the previous answer until
+        configs are reloaded or the global context changes. Only the lookup that
+        fills the cache is recorded for telemetry; reused answers are not.
+        Levels from rules that match on the current time are never cached.
+        """
+        if Context.get_current().contexts:
+            # Log levels can target the current request's context; don't cache
+            return self._evaluate_log_level(sdk, logger_name)[0]
+
+        generation = sdk.config_sdk().config_generation()
+        global_context = sdk.global_context
+        entry = self._level_cache.get(logger_name)
+        if (
+            entry is not None
+            and entry[0] is sdk
+            and entry[1] == generation
+            and entry[2] is global_context
+            and entry[3] == global_context.generation
+        ):
+            return entry[4]
+
+        log_level, evaluation = self._evaluate_log_level(sdk, logger_name)
+        if (
+            evaluation is not None
+            and evaluation.config
+            and _reads_current_time(evaluation.config, evaluation.resolver)
+        ):
+            self._level_cache.pop(logger_name, None)
+            return log_level
+        if len(self._level_cache) >= LEVEL_CACHE_SIZE:
+            self._level_cache.clear()
+        self._level_cache[logger_name] = (
+            sdk,
+            generation,
+            global_context,
+            global_context.generation,
+            log_level,
+        )
+        return log_level
+
+    @staticmethod
+    def _evaluate_log_level(
+        sdk: ReforgeSDK, logger_name: str
+    ) -> Tuple[LogLevel, Optional[Evaluation]]:
+        """
+        Evaluate the level with SDK-internal logging muted on this thread, so
+        records the evaluation emits can't re-enter this filter/processor.
+        """
+        # The token API rather than REENTRANT: this runs for every uncached
+        # record, and a with-block costs two extra Python-level calls
+        token = ReentrancyCheck.set()
+        try:
+            return sdk._log_level_evaluation(logger_name)
+        finally:
+            ReentrancyCheck.clear(token)
+
 
 class LoggerFilter(BaseLoggerFilterProcessor, logging.Filter):
     """
@@ -49,6 +169,7 @@ class LoggerFilter(BaseLoggerFilterProcessor, logging.Filter):
 
     This filter dynamically adjusts log levels based on Reforge configuration.
     Will get its SDK reference from sdk_reforge.get_sdk() unless overridden.
+    The level for each logger name is cached until configs are reloaded.
 
     Example usage:
         import logging
@@ -99,6 +220,8 @@ if STRUCTLOG_AVAILABLE:
 
         This processor dynamically adjusts log levels based on Reforge configuration.
         Will get its SDK reference from sdk_reforge.get_sdk() unless overridden.
+        The level for each logger name is cached until configs are reloaded, so
+        repeated events from the same logger cost a single dict lookup.
 
         Example usage:
             import structlog
@@ -118,7 +241,8 @@ if STRUCTLOG_AVAILABLE:
 
         def logger_name(self, logger: Any, event_dict: dict) -> Optional[str]:
             """
-            Override this method to derive a different logger name.
+            Override this method to derive a different logger name. It is called
+            for every event; only the level lookup for the returned name is cached.
 
             Args:
                 logger: The structlog logger instance
@@ -183,17 +307,20 @@ if STRUCTLOG_AVAILABLE:
 
             # Try to derive from level string or method name
             string_level = event_dict.get("level") or method_name
-
-            # Remap levels per structlog conventions
-            if string_level == "warn":
-                string_level = "warning"
-            elif string_level == "exception":
-                string_level = "error"
-
-            if string_level:
-                maybe_numeric_level = logging.getLevelName(string_level.upper())
-                if type(maybe_numeric_level) == int:
-                    return maybe_numeric_level
+            if not string_level:
+                return None
+
+            # structlog's own level names, including its "warn"/"exception" aliases
+            known_level = _STRUCTLOG_LEVEL_NUMBERS.get(string_level)
+            if known_level is None:
+                known_level = _STRUCTLOG_LEVEL_NUMBERS.get(string_level.lower())
+            if known_level is not None:
+                return known_level
+
+            # Fall back to the logging module for custom level names
+            maybe_numeric_level = logging.getLevelName(string_level.upper())
+            if type(maybe_numeric_level) == int:
+                return maybe_numeric_level
             return None
 
 else:
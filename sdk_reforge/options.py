@@ -5,6 +5,7 @@ from enum import Enum
 from urllib.parse import urlparse
 from typing import Optional, Callable, Type
 
+from ._requests import DEFAULT_POOL_SIZE
 from .context import Context
 from .constants import ContextDictType
 
@@ -45,6 +46,15 @@ class InvalidStreamUrlException(Exception):
         super().__init__(f"Invalid Stream URL found: {url}")
 
 
+class InvalidHttpPoolSizeException(Exception):
+    """
+    Raised when http_pool_size is less than 1
+    """
+
+    def __init__(self, pool_size: int) -> None:
+        super().__init__(f"Invalid HTTP pool size: {pool_size}, must be at least 1")
+
+
 VALID_DATASOURCES = ("LOCAL_ONLY", "ALL")
 VALID_ON_NO_DEFAULT = ("RAISE", "RETURN_NONE")
 VALID_ON_CONNECTION_FAILURE = ("RETURN", "RAISE")
@@ -76,6 +86,7 @@ class Options:
         global_context: Optional[ContextDictType | Context] = None,
         on_ready_callback: Optional[Callable[[], None]] = None,
         logger_key: str = "log-levels.default",
+        http_pool_size: int = DEFAULT_POOL_SIZE,
     ) -> None:
         self.reforge_datasources = Options.__validate_datasource(reforge_datasources)
         self.datafile = x_datafile
@@ -111,6 +122,7 @@ class Options:
         self.global_context = Context.normalize_context_arg(global_context)
         self.on_ready_callback = on_ready_callback
         self.logger_key = logger_key
+        self.__set_http_pool_size(http_pool_size)
 
     def is_local_only(self) -> bool:
         return self.reforge_datasources == "LOCAL_ONLY"
@@ -207,6 +219,11 @@ class Options:
         else:
             self.on_no_default = "RAISE"
 
+    def __set_http_pool_size(self, pool_size: int) -> None:
+        if pool_size < 1:
+            raise InvalidHttpPoolSizeException(pool_size)
+        self.http_pool_size = pool_size
+
     def __set_on_connection_failure(self, value: str) -> None:
         if value in VALID_ON_CONNECTION_FAILURE:
             self.on_connection_failure = value
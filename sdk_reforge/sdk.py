@@ -5,14 +5,15 @@ from urllib3 import Retry
 
 
 from ._telemetry import TelemetryManager
-from ._internal_logging import InternalLogger
+from ._internal_logging import LOG_LEVELS, get_internal_logger
 from .context import Context, ScopedContext
 from .config_sdk import ConfigSDK
+from .config_resolver import Evaluation
 from .feature_flag_sdk import FeatureFlagSDK
 from .options import Options
 from ._requests import TimeoutHTTPAdapter, VersionHeader, Version
 from .log_level import LogLevel
-from typing import Optional
+from typing import Optional, Tuple
 import prefab_pb2 as Prefab
 import uuid
 import requests
@@ -24,7 +25,14 @@ from .constants import (
     PostBodyType,
 )
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
+
+# Protobuf LogLevel values are small fixed ints, so map them to our LogLevel
+# enum with a list indexed by the protobuf value; unused slots fall to DEBUG
+_PREFAB_TO_LOG_LEVEL = [LogLevel.DEBUG] * (max(Prefab.LogLevel.values()) + 1)
+for _name, _level in LogLevel.__members__.items():  # includes the DEBUG alias
+    _PREFAB_TO_LOG_LEVEL[getattr(LOG_LEVELS, _name)] = _level
+del _name, _level
 
 
 class ReforgeSDK:
@@ -108,36 +116,38 @@ class ReforgeSDK:
         Returns:
             LogLevel: The log level for this logger
         """
+        return self._log_level_evaluation(logger_name)[0]
+
+    def _log_level_evaluation(
+        self, logger_name: str
+    ) -> Tuple[LogLevel, Optional[Evaluation]]:
+        """
+        get_log_level, also returning the evaluation the level came from (None
+        if the logger key has no config) so callers that reuse the level can
+        tell whether its rules depend on anything besides the context.
+        """
         log_context = {
             "reforge-sdk-logging": {"lang": "python", "logger-path": logger_name}
         }
 
+        evaluation = None
         try:
-            # Get the protobuf LogLevel value from the config
-            pb_log_level = self.get(
-                self.options.logger_key, default=None, context=log_context
-            )
-
-            if pb_log_level is None:
-                return LogLevel.DEBUG
+            # Same routing as get(), so both agree on the logger key's value
+            key = self.options.logger_key
+            source = self.feature_flag_sdk() if self.is_ff(key) else self.config_sdk()
+            evaluation = source.get_evaluation(key, context=log_context)
+            if evaluation is None or not evaluation.config:
+                return LogLevel.DEBUG, evaluation
 
             # Map from protobuf LogLevel to our LogLevel enum
-            if pb_log_level == Prefab.LogLevel.Value("TRACE"):
-                return LogLevel.TRACE
-            elif pb_log_level == Prefab.LogLevel.Value("DEBUG"):
-                return LogLevel.DEBUG
-            elif pb_log_level == Prefab.LogLevel.Value("INFO"):
-                return LogLevel.INFO
-            elif pb_log_level == Prefab.LogLevel.Value("WARN"):
-                return LogLevel.WARN
-            elif pb_log_level == Prefab.LogLevel.Value("ERROR"):
-                return LogLevel.ERROR
-            elif pb_log_level == Prefab.LogLevel.Value("FATAL"):
-                return LogLevel.FATAL
-            else:
-                return LogLevel.DEBUG
+            pb_log_level = evaluation.unwrapped_value()
+            if type(pb_log_level) is int and 0 <= pb_log_level < len(
+                _PREFAB_TO_LOG_LEVEL
+            ):
+                return _PREFAB_TO_LOG_LEVEL[pb_log_level], evaluation
+            return LogLevel.DEBUG, evaluation
         except Exception:
-            return LogLevel.DEBUG
+            return LogLevel.DEBUG, evaluation
 
     def context(self) -> Context:
         return Context.get_current()
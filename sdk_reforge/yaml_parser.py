@@ -1,8 +1,8 @@
 from .config_parser import ConfigParser
 import yaml
-from ._internal_logging import InternalLogger
+from ._internal_logging import get_internal_logger
 
-logger = InternalLogger(__name__)
+logger = get_internal_logger(__name__)
 
 
 class YamlParser:
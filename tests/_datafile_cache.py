@@ -0,0 +1,31 @@
+import functools
+import json
+from pathlib import Path
+from typing import Any
+
+from google.protobuf.json_format import ParseDict
+
+import prefab_pb2 as Prefab
+
+
+@functools.lru_cache(maxsize=None)
+def _load_datafile(path: str) -> Any:
+    return json.loads(Path(path).read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def _datafile_configs(path: str) -> Prefab.Configs:
+    return ParseDict(_load_datafile(path), Prefab.Configs())
+
+
+def preloaded_local_store(path: str) -> dict[str, dict[str, Any]]:
+    """Return a config_resolver.local_store built from the datafile at path.
+
+    The file is read and decoded once per test session; each call returns a new
+    dict, so tests may add or replace keys without affecting each other. The
+    Config messages themselves are shared and must not be mutated.
+    """
+    return {
+        config.key: {"source": "datafile", "config": config}
+        for config in _datafile_configs(path).configs
+    }
@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+from typing import Generator
+from typing import Optional
+
+import pytest
+
+TMPFS_ROOT = "/dev/shm"
+DATAFILES = ("prefab.datafile.json", "test.datafile.json")
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--rootdir-tmpfs",
+        action="store_true",
+        default=False,
+        help=(
+            f"run tests from a scratch directory under {TMPFS_ROOT}, with the "
+            "datafiles copied there and XDG_CACHE_HOME pointing at it"
+        ),
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def rootdir_tmpfs(
+    request: pytest.FixtureRequest,
+) -> Generator[Optional[str], None, None]:
+    """Move datafile reads and cache writes onto tmpfs when --rootdir-tmpfs is given.
+
+    The working directory becomes a copy of the repo root containing only
+    tests/: the datafiles are copied (so reads come from memory) and every
+    other entry is symlinked, so relative paths used by the tests still resolve.
+    """
+    if not request.config.getoption("--rootdir-tmpfs") or not os.path.isdir(TMPFS_ROOT):
+        yield None
+        return
+
+    root = tempfile.mkdtemp(prefix=f"reforge-tests-{os.getpid()}-", dir=TMPFS_ROOT)
+    tests_dir = os.path.join(root, "tests")
+    os.mkdir(tests_dir)
+    for entry in os.listdir(TESTS_DIR):
+        source = os.path.join(TESTS_DIR, entry)
+        target = os.path.join(tests_dir, entry)
+        if entry in DATAFILES:
+            shutil.copyfile(source, target)
+        else:
+            os.symlink(source, target)
+
+    old_cwd = os.getcwd()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", os.path.join(root, ".cache"))
+        os.chdir(root)
+        try:
+            yield root
+        finally:
+            os.chdir(old_cwd)
+            shutil.rmtree(root, ignore_errors=True)
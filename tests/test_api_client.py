@@ -33,6 +33,12 @@ class TestApiClient(unittest.TestCase):
         resp.headers = headers or {}
         return resp
 
+    def test_session_shares_one_sized_adapter(self):
+        https_adapter = self.client.session.get_adapter("https://a.example.com")
+        http_adapter = self.client.session.get_adapter("http://a.example.com")
+        self.assertIs(https_adapter, http_adapter)
+        self.assertEqual(https_adapter.poolmanager.connection_pool_kw["maxsize"], 4)
+
     @patch.object(ApiClient, "_send_request")
     def test_no_cache(self, mock_send_request):
         # Test that when allow_cache is False, caching is bypassed.
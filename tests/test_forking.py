@@ -1,10 +1,12 @@
 import os
 import threading
+from unittest.mock import Mock
 
 import pytest
 
 import sdk_reforge
 from sdk_reforge import Options
+from sdk_reforge._sse_watchdog import SSEWatchdog
 
 
 def _read_exact(fd: int, size: int) -> bytes:
@@ -96,3 +98,40 @@ def test_child_process_creates_fresh_singleton_sdk_instance() -> None:
     finally:
         os.close(read_fd)
         sdk_reforge.reset_instance()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_child_process_runs_watchdog_checks() -> None:
+    config_client = Mock()
+    config_client.is_shutting_down.return_value = False
+
+    # Make sure the parent's scheduler thread is running when we fork
+    parent_watchdog = SSEWatchdog(config_client, Mock(), Mock(return_value=None))
+    parent_watchdog.start()
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            fired = threading.Event()
+            child_watchdog = SSEWatchdog(
+                config_client,
+                Mock(side_effect=lambda *args: fired.set()),
+                Mock(return_value=None),
+                check_interval=0.02,
+                max_silence=0.05,
+            )
+            child_watchdog.start()
+            os.write(write_fd, b"ok" if fired.wait(timeout=2) else b"no")
+        finally:
+            os.close(write_fd)
+            os._exit(0)
+
+    os.close(write_fd)
+    try:
+        os.waitpid(pid, 0)
+        assert _read_exact(read_fd, 2) == b"ok"
+    finally:
+        os.close(read_fd)
+        parent_watchdog.stop()
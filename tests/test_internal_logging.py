@@ -0,0 +1,109 @@
+import logging
+
+import prefab_pb2 as Prefab
+from sdk_reforge._internal_logging import LOG_LEVELS
+from sdk_reforge._internal_logging import REENTRANT
+from sdk_reforge._internal_logging import InternalLogger
+from sdk_reforge._internal_logging import ReentrancyCheck
+from sdk_reforge._internal_logging import get_internal_logger
+from sdk_reforge._internal_logging import iterate_dotted_string
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class TestInternalLogger:
+    def test_marks_records_as_internal(self) -> None:
+        logger = get_internal_logger("sdk_reforge.tests.internal_marks")
+        handler = RecordingHandler()
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
+        logger.info("hello", extra={"other": 1})
+
+        assert len(handler.records) == 1
+        assert handler.records[0].__dict__["prefab_internal"] is True
+        assert handler.records[0].__dict__["other"] == 1
+
+    def test_get_internal_logger_joins_hierarchy(self) -> None:
+        parent = logging.getLogger("sdk_reforge.tests.hierarchy")
+        logger = get_internal_logger("sdk_reforge.tests.hierarchy.child")
+
+        assert isinstance(logger, InternalLogger)
+        assert logger.parent is parent
+        assert logging.getLogger("sdk_reforge.tests.hierarchy.child") is logger
+
+    def test_skips_records_while_reentrant(self) -> None:
+        logger = get_internal_logger("sdk_reforge.tests.internal_reentrant")
+        handler = RecordingHandler()
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
+        token = ReentrancyCheck.set()
+        try:
+            logger.info("suppressed")
+        finally:
+            ReentrancyCheck.clear(token)
+        logger.info("emitted")
+
+        assert not ReentrancyCheck.is_set()
+        assert [r.getMessage() for r in handler.records] == ["emitted"]
+
+    def test_reentrant_guard_nests(self) -> None:
+        logger = get_internal_logger("sdk_reforge.tests.internal_nested")
+        handler = RecordingHandler()
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
+        with REENTRANT:
+            with REENTRANT:
+                logger.info("inner")
+            logger.info("outer")
+        logger.info("after")
+
+        assert not ReentrancyCheck.is_set()
+        assert [r.getMessage() for r in handler.records] == ["after"]
+
+    def test_token_clear_inside_guard_keeps_outer_set(self) -> None:
+        with REENTRANT:
+            token = ReentrancyCheck.set()
+            ReentrancyCheck.clear(token)
+            assert ReentrancyCheck.is_set()
+        assert not ReentrancyCheck.is_set()
+
+    def test_follows_hierarchy_level_changes(self) -> None:
+        parent = logging.getLogger("sdk_reforge.tests.hierarchy_levels")
+        logger = get_internal_logger("sdk_reforge.tests.hierarchy_levels.child")
+        handler = RecordingHandler()
+        logger.addHandler(handler)
+        parent.setLevel(logging.WARNING)
+
+        logger.info("dropped")
+        parent.setLevel(logging.DEBUG)
+        logger.info("kept")
+
+        logging.disable(logging.INFO)
+        try:
+            logger.info("disabled")
+        finally:
+            logging.disable(logging.NOTSET)
+        logger.info("kept again")
+
+        assert [r.getMessage() for r in handler.records] == ["kept", "kept again"]
+
+
+def test_iterate_dotted_string() -> None:
+    assert list(iterate_dotted_string("a.b.c")) == ["a.b.c", "a.b", "a"]
+    assert list(iterate_dotted_string("a")) == ["a"]
+    assert list(iterate_dotted_string("a..b")) == ["a..b", "a.", "a"]
+
+
+def test_log_levels_match_protobuf_enum() -> None:
+    for name in ("TRACE", "DEBUG", "INFO", "WARN", "ERROR", "FATAL"):
+        assert getattr(LOG_LEVELS, name) == Prefab.LogLevel.Value(name)
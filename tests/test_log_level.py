@@ -1,18 +1,10 @@
 import logging
-import os
-from contextlib import contextmanager
-from sdk_reforge import ReforgeSDK, Options, LogLevel
-
+from typing import Any
+from unittest.mock import Mock, patch
 
-@contextmanager
-def extended_env(new_env_vars):  # type: ignore[no-untyped-def]
-    old_env = os.environ.copy()
-    os.environ.update(new_env_vars)
-    try:
-        yield
-    finally:
-        os.environ.clear()
-        os.environ.update(old_env)
+import prefab_pb2 as Prefab
+import pytest
+from sdk_reforge import ReforgeSDK, Options, LogLevel
 
 
 class TestLogLevel:
@@ -25,22 +17,109 @@ class TestLogLevel:
         assert LogLevel.ERROR.python_level == logging.ERROR
         assert LogLevel.FATAL.python_level == logging.CRITICAL
 
-    def test_get_log_level_returns_debug_when_not_found(self) -> None:
+    def test_get_log_level_returns_debug_when_not_found(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that get_log_level returns DEBUG when config not found"""
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            sdk = ReforgeSDK(
-                Options(
-                    x_datafile="tests/test.datafile.json",
-                    logger_key="nonexistent.key",
-                    collect_sync_interval=None,
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        sdk = ReforgeSDK(
+            Options(
+                x_datafile="tests/test.datafile.json",
+                logger_key="nonexistent.key",
+                collect_sync_interval=None,
+            )
+        )
+
+        level = sdk.get_log_level("any.logger")
+        assert level == LogLevel.DEBUG
+
+    def test_get_log_level_maps_each_prefab_level(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that each protobuf LogLevel maps to the matching LogLevel"""
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        sdk = ReforgeSDK(
+            Options(
+                x_datafile="tests/test.datafile.json",
+                collect_sync_interval=None,
+            )
+        )
+
+        def evaluating_to(value: object) -> Any:
+            evaluation = Mock(config=Mock())
+            evaluation.unwrapped_value.return_value = value
+            return patch.object(
+                sdk.config_sdk(), "get_evaluation", return_value=evaluation
+            )
+
+        for name in ("TRACE", "DEBUG", "INFO", "WARN", "ERROR", "FATAL"):
+            with evaluating_to(Prefab.LogLevel.Value(name)):
+                assert sdk.get_log_level("any.logger") == LogLevel[name]
+
+        for unexpected in (0, 99, -1, "INFO"):
+            with evaluating_to(unexpected):
+                assert sdk.get_log_level("any.logger") == LogLevel.DEBUG
+
+    def test_get_log_level_agrees_with_get_for_feature_flag_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a logger key stored as a feature flag resolves like get()"""
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        sdk = ReforgeSDK(
+            Options(
+                x_datafile="tests/test.datafile.json",
+                logger_key="log-levels.flagged",
+                collect_sync_interval=None,
+            )
+        )
+        flagged = Prefab.Config(
+            key="log-levels.flagged",
+            config_type=Prefab.ConfigType.Value("FEATURE_FLAG"),
+            rows=[
+                Prefab.ConfigRow(
+                    values=[
+                        Prefab.ConditionalValue(
+                            criteria=[
+                                Prefab.Criterion(
+                                    operator=Prefab.Criterion.CriterionOperator.PROP_STARTS_WITH_ONE_OF,
+                                    property_name="reforge-sdk-logging.logger-path",
+                                    value_to_match=Prefab.ConfigValue(
+                                        string_list=Prefab.StringList(values=["noisy"])
+                                    ),
+                                )
+                            ],
+                            value=Prefab.ConfigValue(
+                                log_level=Prefab.LogLevel.Value("ERROR")
+                            ),
+                        ),
+                        Prefab.ConditionalValue(
+                            value=Prefab.ConfigValue(
+                                log_level=Prefab.LogLevel.Value("INFO")
+                            )
+                        ),
+                    ]
                 )
+            ],
+        )
+        sdk.config_sdk().config_resolver.local_store[flagged.key] = {"config": flagged}
+
+        for logger_name, expected in (("noisy.module", "ERROR"), ("app", "INFO")):
+            value = sdk.get(
+                flagged.key,
+                context={
+                    "reforge-sdk-logging": {
+                        "lang": "python",
+                        "logger-path": logger_name,
+                    }
+                },
             )
+            assert value == Prefab.LogLevel.Value(expected)
+            assert sdk.get_log_level(logger_name) == LogLevel[expected]
 
-            level = sdk.get_log_level("any.logger")
-            assert level == LogLevel.DEBUG
+        sdk.close()
 
-    def test_logger_key_default_value(self) -> None:
+    def test_logger_key_default_value(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that logger_key has the correct default value"""
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options()
-            assert options.logger_key == "log-levels.default"
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = Options()
+        assert options.logger_key == "log-levels.default"
@@ -1,44 +1,33 @@
 from __future__ import annotations
 
 import logging
-import os
 import sys
 import re
-from contextlib import contextmanager
 from typing import Any, Generator, Optional, Tuple
+from unittest.mock import patch
 
 import pytest
 import prefab_pb2 as Prefab
+from structlog import DropEvent
 
-from sdk_reforge import ReforgeSDK, Options
+from sdk_reforge import ReforgeSDK, Options, Context, LogLevel
+from sdk_reforge._internal_logging import get_internal_logger
 from sdk_reforge.logging import LoggerFilter, LoggerProcessor
+from tests._datafile_cache import preloaded_local_store
 
+_FMT = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+# Parses lines written with _FMT into (name, level, message)
+_LINE_RE = re.compile(r"^\S+ \S+ - (?P<name>\S+) - (?P<level>\S+) - (?P<msg>.*)$")
 
-@contextmanager
-def extended_env(new_env_vars: dict[str, str]) -> Generator[None, None, None]:
-    old_env = os.environ.copy()
-    os.environ.update(new_env_vars)
-    try:
-        yield
-    finally:
-        os.environ.clear()
-        os.environ.update(old_env)
-
-
-def assert_logged(
-    cap: Any, level: str, msg: str, logger_name: str, should_log: bool = True
-) -> None:
-    """Check if a message was logged to stdout"""
-    pattern = re.compile(f".*{logger_name or 'root'}.*{level}.*{msg}.*")
-    stdout, stderr = cap.readouterr()
-    if should_log:
-        assert pattern.match(
-            stdout
-        ), f"Expected to find '{msg}' at level '{level}' in stdout"
-    else:
-        assert not pattern.match(
-            stdout
-        ), f"Did not expect to find '{msg}' at level '{level}' in stdout"
+
+def logged_lines(cap: Any) -> set[Tuple[str, str, str]]:
+    """Drain captured stdout once and parse it into (name, level, message) tuples"""
+    stdout, _ = cap.readouterr()
+    return {
+        (match["name"], match["level"], match["msg"])
+        for match in map(_LINE_RE.match, stdout.splitlines())
+        if match
+    }
 
 
 def configure_logger(
@@ -49,153 +38,331 @@ def configure_logger(
     logger.setLevel(logging.DEBUG)
     logger.handlers.clear()  # Clear any existing handlers
 
+    # sys.stdout is swapped by capsys per test, so the handler can't be shared
     ch = logging.StreamHandler(sys.stdout)
     ch.setLevel(logging.DEBUG)
-    ch.setFormatter(
-        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    )
+    ch.setFormatter(_FMT)
     logger.addHandler(ch)
 
     return (logger, ch)
 
 
-@pytest.fixture
-def sdk_with_log_config():  # type: ignore[no-untyped-def]
-    """Create SDK with a log level config"""
-    with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-        sdk = ReforgeSDK(
-            Options(
-                x_datafile="tests/test.datafile.json",
-                logger_key="test.log.level",
-                collect_sync_interval=None,
-            )
-        )
-
-        # Create a log level config: INFO by default
-        config = Prefab.Config(
-            key="test.log.level",
-            config_type=Prefab.ConfigType.Value("LOG_LEVEL_V2"),
-            rows=[
-                Prefab.ConfigRow(
-                    values=[
-                        Prefab.ConditionalValue(
-                            value=Prefab.ConfigValue(
-                                log_level=Prefab.LogLevel.Value("INFO")
-                            )
-                        )
-                    ]
+# A log level config: INFO by default
+LOG_LEVEL_CONFIG = Prefab.Config(
+    key="test.log.level",
+    config_type=Prefab.ConfigType.Value("LOG_LEVEL_V2"),
+    rows=[
+        Prefab.ConfigRow(
+            values=[
+                Prefab.ConditionalValue(
+                    value=Prefab.ConfigValue(log_level=Prefab.LogLevel.Value("INFO"))
                 )
-            ],
+            ]
         )
+    ],
+)
 
-        sdk.config_sdk().config_resolver.local_store[config.key] = {"config": config}
 
+@pytest.fixture(scope="module")
+def log_config_sdk() -> Generator[ReforgeSDK, None, None]:
+    """SDK shared by the tests in this module that read the log level config"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        sdk = ReforgeSDK(
+            Options(logger_key="test.log.level", collect_sync_interval=None)
+        )
         yield sdk
         sdk.close()
 
 
+@pytest.fixture
+def sdk_with_log_config(log_config_sdk: ReforgeSDK) -> ReforgeSDK:
+    """The shared SDK with the datafile configs and log level config (re)installed"""
+    local_store = preloaded_local_store("tests/test.datafile.json")
+    local_store[LOG_LEVEL_CONFIG.key] = {"config": LOG_LEVEL_CONFIG}
+    log_config_sdk.config_sdk().config_resolver.local_store = local_store
+    return log_config_sdk
+
+
 class TestLoggerFilter:
     def test_filter_allows_logs_at_or_above_configured_level(
         self, sdk_with_log_config: Any, capsys: Any
     ) -> None:
         """Test that LoggerFilter allows logs at or above the configured level"""
-        (logger, ch) = configure_logger("test.logger")
+        logger, ch = configure_logger("test.logger")
         log_filter = LoggerFilter(sdk=sdk_with_log_config)
         ch.addFilter(log_filter)
 
-        # DEBUG should be filtered (below INFO)
         logger.debug("Debug message")
-        assert_logged(capsys, "DEBUG", "Debug message", "test.logger", should_log=False)
-
-        # INFO should pass
         logger.info("Info message")
-        assert_logged(capsys, "INFO", "Info message", "test.logger", should_log=True)
-
-        # WARNING should pass
         logger.warning("Warning message")
-        assert_logged(
-            capsys, "WARNING", "Warning message", "test.logger", should_log=True
-        )
-
-        # ERROR should pass
         logger.error("Error message")
-        assert_logged(capsys, "ERROR", "Error message", "test.logger", should_log=True)
+        lines = logged_lines(capsys)
+
+        # DEBUG should be filtered (below INFO)
+        assert ("test.logger", "DEBUG", "Debug message") not in lines
+        # INFO, WARNING and ERROR should pass
+        assert ("test.logger", "INFO", "Info message") in lines
+        assert ("test.logger", "WARNING", "Warning message") in lines
+        assert ("test.logger", "ERROR", "Error message") in lines
 
     def test_filter_returns_true_when_sdk_not_available(self, capsys: Any) -> None:
         """Test that filter allows all logs when SDK is not available"""
-        (logger, ch) = configure_logger("test.logger")
+        logger, ch = configure_logger("test.logger")
         log_filter = LoggerFilter(sdk=None)  # No SDK
         ch.addFilter(log_filter)
 
-        # All levels should pass when SDK not available
         logger.debug("Debug message")
-        assert_logged(capsys, "DEBUG", "Debug message", "test.logger", should_log=True)
-
         logger.info("Info message")
-        assert_logged(capsys, "INFO", "Info message", "test.logger", should_log=True)
+        lines = logged_lines(capsys)
 
-    def test_filter_uses_default_debug_when_config_not_found(self, capsys: Any) -> None:
+        # All levels should pass when SDK not available
+        assert ("test.logger", "DEBUG", "Debug message") in lines
+        assert ("test.logger", "INFO", "Info message") in lines
+
+    def test_filter_uses_default_debug_when_config_not_found(
+        self, capsys: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that filter uses DEBUG level when config not found"""
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            sdk = ReforgeSDK(
-                Options(
-                    x_datafile="tests/test.datafile.json",
-                    logger_key="nonexistent.key",
-                    collect_sync_interval=None,
-                )
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        sdk = ReforgeSDK(
+            Options(
+                x_datafile="tests/test.datafile.json",
+                logger_key="nonexistent.key",
+                collect_sync_interval=None,
             )
+        )
 
-            (logger, ch) = configure_logger("test.logger")
-            log_filter = LoggerFilter(sdk=sdk)
-            ch.addFilter(log_filter)
+        logger, ch = configure_logger("test.logger")
+        log_filter = LoggerFilter(sdk=sdk)
+        ch.addFilter(log_filter)
 
-            # With default DEBUG, all levels should pass
-            logger.debug("Debug message")
-            assert_logged(
-                capsys, "DEBUG", "Debug message", "test.logger", should_log=True
-            )
+        logger.debug("Debug message")
+        logger.info("Info message")
+        lines = logged_lines(capsys)
 
-            logger.info("Info message")
-            assert_logged(
-                capsys, "INFO", "Info message", "test.logger", should_log=True
-            )
+        # With default DEBUG, all levels should pass
+        assert ("test.logger", "DEBUG", "Debug message") in lines
+        assert ("test.logger", "INFO", "Info message") in lines
 
-            sdk.close()
+        sdk.close()
 
+    def test_filter_caches_level_until_configs_reload(
+        self, sdk_with_log_config: Any
+    ) -> None:
+        """Test that the configured level is looked up once per config generation"""
+        log_filter = LoggerFilter(sdk=sdk_with_log_config)
+        record = logging.LogRecord(
+            "test.logger", logging.INFO, __file__, 1, "msg", None, None
+        )
 
-class TestLoggerProcessor:
-    def test_derive_structlog_numeric_level(self) -> None:
-        """Test the _derive_structlog_numeric_level helper method"""
-        # Test with level_number in dict (highest priority)
-        assert (
-            LoggerProcessor._derive_structlog_numeric_level(
-                "warn", {"level_number": 30}
-            )
-            == 30
+        with patch.object(
+            sdk_with_log_config,
+            "_log_level_evaluation",
+            wraps=sdk_with_log_config._log_level_evaluation,
+        ) as get_log_level:
+            assert log_filter.filter(record)
+            assert log_filter.filter(record)
+            assert get_log_level.call_count == 1
+
+            sdk_with_log_config.config_sdk().load_configs(Prefab.Configs(), "test")
+            assert log_filter.filter(record)
+            assert get_log_level.call_count == 2
+
+    def test_filter_skips_cache_with_current_context(
+        self, sdk_with_log_config: Any
+    ) -> None:
+        """Test that levels are re-evaluated while a request context is set"""
+        log_filter = LoggerFilter(sdk=sdk_with_log_config)
+        record = logging.LogRecord(
+            "test.logger", logging.INFO, __file__, 1, "msg", None, None
         )
 
-        # Test with level string in dict
-        assert (
-            LoggerProcessor._derive_structlog_numeric_level(
-                "warn", {"level": "warning"}
-            )
-            == 30
+        with patch.object(
+            sdk_with_log_config,
+            "_log_level_evaluation",
+            wraps=sdk_with_log_config._log_level_evaluation,
+        ) as get_log_level:
+            with Context.scope({"user": {"key": "abc"}}):
+                assert log_filter.filter(record)
+                assert log_filter.filter(record)
+            assert get_log_level.call_count == 2
+
+    def test_filter_records_evaluation_only_when_filling_cache(
+        self, sdk_with_log_config: Any
+    ) -> None:
+        """Test that a cached level is not reported again on reuse"""
+        log_filter = LoggerFilter(sdk=sdk_with_log_config)
+        record = logging.LogRecord(
+            "test.logger", logging.INFO, __file__, 1, "msg", None, None
         )
 
-        # Test with method_name
-        assert LoggerProcessor._derive_structlog_numeric_level("warning", {}) == 30
+        with patch.object(
+            sdk_with_log_config.telemetry_manager, "record_evaluation"
+        ) as record_evaluation:
+            assert log_filter.filter(record)
+            assert log_filter.filter(record)
+            assert record_evaluation.call_count == 1
 
-        # Test warn alias
-        assert LoggerProcessor._derive_structlog_numeric_level("warn", {}) == 30
+    def test_filter_does_not_cache_levels_from_current_time_rules(
+        self, sdk_with_log_config: Any
+    ) -> None:
+        """Test that a "DEBUG until T" rule stops applying once T has passed"""
+        until_millis = 1_700_000_000_000
+        debug_until = Prefab.Config(
+            key=LOG_LEVEL_CONFIG.key,
+            config_type=Prefab.ConfigType.Value("LOG_LEVEL_V2"),
+            rows=[
+                Prefab.ConfigRow(
+                    values=[
+                        Prefab.ConditionalValue(
+                            criteria=[
+                                Prefab.Criterion(
+                                    operator=Prefab.Criterion.CriterionOperator.PROP_BEFORE,
+                                    property_name="reforge.current-time",
+                                    value_to_match=Prefab.ConfigValue(int=until_millis),
+                                )
+                            ],
+                            value=Prefab.ConfigValue(
+                                log_level=Prefab.LogLevel.Value("DEBUG")
+                            ),
+                        ),
+                        Prefab.ConditionalValue(
+                            value=Prefab.ConfigValue(
+                                log_level=Prefab.LogLevel.Value("INFO")
+                            )
+                        ),
+                    ]
+                )
+            ],
+        )
+        local_store = sdk_with_log_config.config_sdk().config_resolver.local_store
+        local_store[debug_until.key] = {"config": debug_until}
+        log_filter = LoggerFilter(sdk=sdk_with_log_config)
+        record = logging.LogRecord(
+            "test.logger", logging.DEBUG, __file__, 1, "msg", None, None
+        )
+
+        with patch("sdk_reforge.config_resolver.time.time") as mock_time:
+            mock_time.return_value = until_millis / 1000 - 60
+            assert log_filter.filter(record)
+            mock_time.return_value = until_millis / 1000 + 60
+            assert not log_filter.filter(record)
+
+    def test_filter_reevaluates_after_global_context_changes_in_place(
+        self, sdk_with_log_config: Any
+    ) -> None:
+        """Test that mutating the global context invalidates cached levels"""
+        log_filter = LoggerFilter(sdk=sdk_with_log_config)
+        record = logging.LogRecord(
+            "test.logger", logging.INFO, __file__, 1, "msg", None, None
+        )
+        global_context = sdk_with_log_config.global_context
+
+        with patch.object(
+            sdk_with_log_config,
+            "_log_level_evaluation",
+            wraps=sdk_with_log_config._log_level_evaluation,
+        ) as get_log_level:
+            assert log_filter.filter(record)
+            global_context["team"] = {"name": "core"}
+            try:
+                assert log_filter.filter(record)
+            finally:
+                del global_context.contexts["team"]
+            assert get_log_level.call_count == 2
+
+    def test_filter_reevaluates_after_global_context_is_replaced(
+        self, sdk_with_log_config: Any
+    ) -> None:
+        """Test that set_global_context invalidates cached levels"""
+        log_filter = LoggerFilter(sdk=sdk_with_log_config)
+        record = logging.LogRecord(
+            "test.logger", logging.INFO, __file__, 1, "msg", None, None
+        )
+        original = sdk_with_log_config.global_context
+
+        with patch.object(
+            sdk_with_log_config,
+            "_log_level_evaluation",
+            wraps=sdk_with_log_config._log_level_evaluation,
+        ) as get_log_level:
+            assert log_filter.filter(record)
+            sdk_with_log_config.set_global_context({"team": {"name": "core"}})
+            try:
+                assert log_filter.filter(record)
+            finally:
+                sdk_with_log_config.global_context = original
+            assert get_log_level.call_count == 2
+
+    def test_filter_mutes_internal_logs_during_evaluation(
+        self, sdk_with_log_config: Any, capsys: Any
+    ) -> None:
+        """Test that SDK logs emitted while evaluating a level don't re-enter"""
+        logger, ch = configure_logger("test.logger")
+        ch.addFilter(LoggerFilter(sdk=sdk_with_log_config))
+        internal_logger = get_internal_logger("sdk_reforge.tests.reentrant")
+        internal_logger.addHandler(ch)
+
+        def noisy_get_log_level(logger_name: str) -> Tuple[LogLevel, None]:
+            internal_logger.warning("Internal evaluation warning")
+            return LogLevel.DEBUG, None
+
+        with patch.object(
+            sdk_with_log_config,
+            "_log_level_evaluation",
+            side_effect=noisy_get_log_level,
+        ):
+            logger.info("Info message")
 
-        # Test debug
-        assert LoggerProcessor._derive_structlog_numeric_level("debug", {}) == 10
+        internal_logger.removeHandler(ch)
+        lines = logged_lines(capsys)
+        assert ("test.logger", "INFO", "Info message") in lines
+        assert all(msg != "Internal evaluation warning" for _, _, msg in lines)
 
-        # Test info
-        assert LoggerProcessor._derive_structlog_numeric_level("info", {}) == 20
 
-        # Test error
-        assert LoggerProcessor._derive_structlog_numeric_level("error", {}) == 40
+class TestLoggerProcessor:
+    @pytest.mark.parametrize(
+        "method_name,event_dict,expected",
+        [
+            # level_number in dict has the highest priority
+            ("warn", {"level_number": 30}, 30),
+            # level string in dict
+            ("warn", {"level": "warning"}, 30),
+            # method_name
+            ("warning", {}, 30),
+            ("warn", {}, 30),  # warn alias
+            ("debug", {}, 10),
+            ("info", {}, 20),
+            ("error", {}, 40),
+            ("exception", {}, 40),  # exception alias maps to error
+            # level names are matched case-insensitively
+            ("info", {"level": "WARNING"}, 30),
+        ],
+    )
+    def test_derive_structlog_numeric_level(
+        self, method_name: str, event_dict: dict[str, Any], expected: int
+    ) -> None:
+        """Test the _derive_structlog_numeric_level helper method"""
+        assert (
+            LoggerProcessor._derive_structlog_numeric_level(method_name, event_dict)
+            == expected
+        )
 
-        # Test exception alias (maps to error)
-        assert LoggerProcessor._derive_structlog_numeric_level("exception", {}) == 40
+    def test_processor_caches_level_per_logger_name(
+        self, sdk_with_log_config: Any
+    ) -> None:
+        """Test that repeated events from one logger evaluate the level once"""
+        log_processor = LoggerProcessor(sdk=sdk_with_log_config)
+        event_dict = {"logger": "test.logger", "level": "info"}
+
+        with patch.object(
+            sdk_with_log_config,
+            "_log_level_evaluation",
+            wraps=sdk_with_log_config._log_level_evaluation,
+        ) as get_log_level:
+            for _ in range(3):
+                assert log_processor.processor(None, "info", event_dict) is event_dict
+            with pytest.raises(DropEvent):
+                log_processor.processor(None, "debug", {"logger": "test.logger"})
+            assert get_log_level.call_count == 1
@@ -1,45 +1,63 @@
 from sdk_reforge import Options
+from sdk_reforge._requests import DEFAULT_POOL_SIZE
 from sdk_reforge.options import (
     MissingSdkKeyException,
     InvalidSdkKeyException,
     InvalidApiUrlException,
     InvalidStreamUrlException,
+    InvalidHttpPoolSizeException,
 )
 
 import os
 import pytest
 
-from contextlib import contextmanager
+# Environment variables Options reads while it is constructed
+OPTIONS_ENV_VARS = (
+    "REFORGE_BACKEND_SDK_KEY",
+    "PREFAB_API_KEY",
+    "REFORGE_HTTP",
+    "REFORGE_DATASOURCES",
+    "REFORGE_API_URL",
+    "REFORGE_STREAM_URL",
+)
+
 
+@pytest.fixture(scope="class")
+def options_factory():
+    """Build Options, reusing instances for repeated kwargs and environment"""
+    cache = {}
 
-@contextmanager
-def extended_env(new_env_vars):
-    old_env = os.environ.copy()
-    os.environ.update(new_env_vars)
-    yield
-    os.environ.clear()
-    os.environ.update(old_env)
+    def make(**kwargs):
+        key = (
+            repr(sorted(kwargs.items())),
+            tuple(os.environ.get(name) for name in OPTIONS_ENV_VARS),
+        )
+        if key not in cache:
+            cache[key] = Options(**kwargs)
+        return cache[key]
+
+    return make
 
 
 class TestOptionsApiKey:
-    def test_valid_api_key_from_input(self):
-        options = Options(sdk_key="1-dev-api-key")
+    def test_valid_api_key_from_input(self, options_factory):
+        options = options_factory(sdk_key="1-dev-api-key")
         assert options.api_key == "1-dev-api-key"
         assert options.api_key_id == "1"
 
-    def test_valid_api_key_from_env(self):
-        with extended_env({"PREFAB_API_KEY": "2-test-api-key"}):
-            options = Options()
+    def test_valid_api_key_from_env(self, options_factory, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "2-test-api-key")
+        options = options_factory()
 
-            assert options.api_key == "2-test-api-key"
-            assert options.api_key_id == "2"
+        assert options.api_key == "2-test-api-key"
+        assert options.api_key_id == "2"
 
-    def test_api_key_from_input_overrides_env(self):
-        with extended_env({"PREFAB_API_KEY": "2-test-api-key"}):
-            options = Options(sdk_key="3-dev-api-key")
+    def test_api_key_from_input_overrides_env(self, options_factory, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "2-test-api-key")
+        options = options_factory(sdk_key="3-dev-api-key")
 
-            assert options.api_key == "3-dev-api-key"
-            assert options.api_key_id == "3"
+        assert options.api_key == "3-dev-api-key"
+        assert options.api_key_id == "3"
 
     def test_missing_sdk_key_error(self):
         with pytest.raises(MissingSdkKeyException) as context:
@@ -52,64 +70,68 @@ class TestOptionsApiKey:
             Options(sdk_key="bad_sdk_key")
             assert "Invalid SDK key: bad_sdk_key" in str(context)
 
-    def test_api_key_doesnt_matter_local_only_set_in_env(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options(sdk_key="bad_api_key")
-            assert options.api_key is None
-            assert options.api_key_id == "local"
+    def test_api_key_doesnt_matter_local_only_set_in_env(
+        self, options_factory, monkeypatch
+    ):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory(sdk_key="bad_api_key")
+        assert options.api_key is None
+        assert options.api_key_id == "local"
 
-    def test_api_key_doesnt_matter_local_only(self):
-        options = Options(sdk_key="bad_api_key", reforge_datasources="LOCAL_ONLY")
+    def test_api_key_doesnt_matter_local_only(self, options_factory):
+        options = options_factory(
+            sdk_key="bad_api_key", reforge_datasources="LOCAL_ONLY"
+        )
         assert options.api_key is None
 
-    def test_api_key_strips_whitespace(self):
-        options = Options(sdk_key="2-test-api-key\n")
+    def test_api_key_strips_whitespace(self, options_factory):
+        options = options_factory(sdk_key="2-test-api-key\n")
         assert options.api_key == "2-test-api-key"
 
-    def test_api_key_strips_whitespace_sourced_from_env(self):
-        with extended_env({"PREFAB_API_KEY": " 2-test-api-key\n"}):
-            options = Options()
-            assert options.api_key == "2-test-api-key"
+    def test_api_key_strips_whitespace_sourced_from_env(
+        self, options_factory, monkeypatch
+    ):
+        monkeypatch.setenv("PREFAB_API_KEY", " 2-test-api-key\n")
+        options = options_factory()
+        assert options.api_key == "2-test-api-key"
 
 
 class TestOptionsApiUrl:
-    def test_prefab_api_url_from_env(self):
-        with extended_env(
-            {
-                "PREFAB_API_KEY": "1-api",
-                "REFORGE_API_URL": "https://api.dev-prefab.cloud",
-            }
-        ):
-            options = Options()
-            assert options.reforge_api_urls == ["https://api.dev-prefab.cloud"]
-
-    def test_api_url_from_input(self):
-        with extended_env({"PREFAB_API_KEY": "1-api"}):
-            options = Options(reforge_api_urls=["https://api.test-prefab.cloud"])
-            assert options.reforge_api_urls == ["https://api.test-prefab.cloud"]
-
-    def test_prefab_api_url_default_fallback(self):
-        with extended_env({"PREFAB_API_KEY": "1-api"}):
-            options = Options()
-            assert options.reforge_api_urls == [
-                "https://primary.reforge.com",
-                "https://secondary.reforge.com",
-            ]
-
-    def test_prefab_api_url_errors_on_invalid_format(self):
-        with extended_env({"PREFAB_API_KEY": "1-api"}):
-            with pytest.raises(InvalidApiUrlException) as context:
-                Options(reforge_api_urls=["httttp://api.prefab.cloud"])
-
-            assert "Invalid API URL found: httttp://api.prefab.cloud" in str(context)
-
-    def test_prefab_api_url_doesnt_matter_local_only_set_in_env(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options(reforge_api_urls=["http://api.prefab.cloud"])
-            assert options.reforge_api_urls is None
-
-    def test_prefab_api_url_doesnt_matter_local_only(self):
-        options = Options(
+    def test_prefab_api_url_from_env(self, options_factory, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "1-api")
+        monkeypatch.setenv("REFORGE_API_URL", "https://api.dev-prefab.cloud")
+        options = options_factory()
+        assert options.reforge_api_urls == ["https://api.dev-prefab.cloud"]
+
+    def test_api_url_from_input(self, options_factory, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "1-api")
+        options = options_factory(reforge_api_urls=["https://api.test-prefab.cloud"])
+        assert options.reforge_api_urls == ["https://api.test-prefab.cloud"]
+
+    def test_prefab_api_url_default_fallback(self, options_factory, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "1-api")
+        options = options_factory()
+        assert options.reforge_api_urls == [
+            "https://primary.reforge.com",
+            "https://secondary.reforge.com",
+        ]
+
+    def test_prefab_api_url_errors_on_invalid_format(self, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "1-api")
+        with pytest.raises(InvalidApiUrlException) as context:
+            Options(reforge_api_urls=["httttp://api.prefab.cloud"])
+
+        assert "Invalid API URL found: httttp://api.prefab.cloud" in str(context)
+
+    def test_prefab_api_url_doesnt_matter_local_only_set_in_env(
+        self, options_factory, monkeypatch
+    ):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory(reforge_api_urls=["http://api.prefab.cloud"])
+        assert options.reforge_api_urls is None
+
+    def test_prefab_api_url_doesnt_matter_local_only(self, options_factory):
+        options = options_factory(
             reforge_api_urls=["http://api.prefab.cloud"],
             reforge_datasources="LOCAL_ONLY",
         )
@@ -117,46 +139,42 @@ class TestOptionsApiUrl:
 
 
 class TestOptionsStreamUrl:
-    def test_prefab_stream_url_from_env(self):
-        with extended_env(
-            {
-                "PREFAB_API_KEY": "1-api",
-                "REFORGE_API_URL": "https://api.dev-prefab.cloud",
-                "REFORGE_STREAM_URL": "https://s.api.dev-prefab.cloud",
-            }
-        ):
-            options = Options()
-            assert options.reforge_stream_urls == ["https://s.api.dev-prefab.cloud"]
-
-    def test_api_url_from_input(self):
-        with extended_env({"PREFAB_API_KEY": "1-api"}):
-            options = Options(
-                reforge_api_urls=["https://api.test-prefab.cloud"],
-                reforge_stream_urls=["https://foo.test-prefab.cloud"],
-            )
-            assert options.reforge_stream_urls == ["https://foo.test-prefab.cloud"]
-
-    def test_prefab_api_url_default_fallback(self):
-        with extended_env({"PREFAB_API_KEY": "1-api"}):
-            options = Options()
-            assert options.reforge_stream_urls == ["https://stream.reforge.com"]
-
-    def test_prefab_api_url_errors_on_invalid_format(self):
-        with extended_env({"PREFAB_API_KEY": "1-api"}):
-            with pytest.raises(InvalidStreamUrlException) as context:
-                Options(reforge_stream_urls=["httttp://stream.prefab.cloud"])
-
-            assert "Invalid Stream URL found: httttp://stream.prefab.cloud" in str(
-                context
-            )
-
-    def test_prefab_api_url_doesnt_matter_local_only_set_in_env(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options(reforge_stream_urls=["http://stream.prefab.cloud"])
-            assert options.reforge_stream_urls is None
-
-    def test_prefab_api_url_doesnt_matter_local_only(self):
-        options = Options(
+    def test_prefab_stream_url_from_env(self, options_factory, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "1-api")
+        monkeypatch.setenv("REFORGE_API_URL", "https://api.dev-prefab.cloud")
+        monkeypatch.setenv("REFORGE_STREAM_URL", "https://s.api.dev-prefab.cloud")
+        options = options_factory()
+        assert options.reforge_stream_urls == ["https://s.api.dev-prefab.cloud"]
+
+    def test_api_url_from_input(self, options_factory, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "1-api")
+        options = options_factory(
+            reforge_api_urls=["https://api.test-prefab.cloud"],
+            reforge_stream_urls=["https://foo.test-prefab.cloud"],
+        )
+        assert options.reforge_stream_urls == ["https://foo.test-prefab.cloud"]
+
+    def test_prefab_api_url_default_fallback(self, options_factory, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "1-api")
+        options = options_factory()
+        assert options.reforge_stream_urls == ["https://stream.reforge.com"]
+
+    def test_prefab_api_url_errors_on_invalid_format(self, monkeypatch):
+        monkeypatch.setenv("PREFAB_API_KEY", "1-api")
+        with pytest.raises(InvalidStreamUrlException) as context:
+            Options(reforge_stream_urls=["httttp://stream.prefab.cloud"])
+
+        assert "Invalid Stream URL found: httttp://stream.prefab.cloud" in str(context)
+
+    def test_prefab_api_url_doesnt_matter_local_only_set_in_env(
+        self, options_factory, monkeypatch
+    ):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory(reforge_stream_urls=["http://stream.prefab.cloud"])
+        assert options.reforge_stream_urls is None
+
+    def test_prefab_api_url_doesnt_matter_local_only(self, options_factory):
+        options = options_factory(
             reforge_stream_urls=["http://stream.prefab.cloud"],
             reforge_datasources="LOCAL_ONLY",
         )
@@ -164,34 +182,54 @@ class TestOptionsStreamUrl:
 
 
 class TestOptionsOnNoDefault:
-    def test_defaults_to_raise(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options()
-            assert options.on_no_default == "RAISE"
+    def test_defaults_to_raise(self, options_factory, monkeypatch):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory()
+        assert options.on_no_default == "RAISE"
 
-    def test_returns_return_none_if_given(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options(on_no_default="RETURN_NONE")
-            assert options.on_no_default == "RETURN_NONE"
+    def test_returns_return_none_if_given(self, options_factory, monkeypatch):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory(on_no_default="RETURN_NONE")
+        assert options.on_no_default == "RETURN_NONE"
 
-    def test_returns_raise_for_any_other_input(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options(on_no_default="WHATEVER")
-            assert options.on_no_default == "RAISE"
+    def test_returns_raise_for_any_other_input(self, options_factory, monkeypatch):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory(on_no_default="WHATEVER")
+        assert options.on_no_default == "RAISE"
 
 
 class TestOptionsOnConnectionFailure:
-    def test_defaults_to_return(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options()
-            assert options.on_connection_failure == "RETURN"
-
-    def test_returns_raise_if_given(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options(on_connection_failure="RAISE")
-            assert options.on_connection_failure == "RAISE"
-
-    def test_returns_return_for_any_other_input(self):
-        with extended_env({"REFORGE_DATASOURCES": "LOCAL_ONLY"}):
-            options = Options(on_connection_failure="WHATEVER")
-            assert options.on_connection_failure == "RETURN"
+    def test_defaults_to_return(self, options_factory, monkeypatch):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory()
+        assert options.on_connection_failure == "RETURN"
+
+    def test_returns_raise_if_given(self, options_factory, monkeypatch):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory(on_connection_failure="RAISE")
+        assert options.on_connection_failure == "RAISE"
+
+    def test_returns_return_for_any_other_input(self, options_factory, monkeypatch):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory(on_connection_failure="WHATEVER")
+        assert options.on_connection_failure == "RETURN"
+
+
+class TestOptionsHttpPoolSize:
+    def test_defaults_to_requests_pool_size(self, options_factory, monkeypatch):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory()
+        assert options.http_pool_size == DEFAULT_POOL_SIZE
+
+    def test_returns_pool_size_if_given(self, options_factory, monkeypatch):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        options = options_factory(http_pool_size=10)
+        assert options.http_pool_size == 10
+
+    @pytest.mark.parametrize("pool_size", [0, -1])
+    def test_errors_on_pool_size_below_one(self, monkeypatch, pool_size):
+        monkeypatch.setenv("REFORGE_DATASOURCES", "LOCAL_ONLY")
+        with pytest.raises(InvalidHttpPoolSizeException) as context:
+            Options(http_pool_size=pool_size)
+
+        assert f"Invalid HTTP pool size: {pool_size}" in str(context)
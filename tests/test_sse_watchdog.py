@@ -1,15 +1,31 @@
+import io
+import threading
 import unittest
 import time
+from collections import deque
+from itertools import count
 from unittest.mock import Mock, patch
 
+from requests import Response
+from urllib3 import HTTPResponse
+
 from sdk_reforge._sse_watchdog import (
+    _SCHEDULER,
     SSEWatchdog,
     WatchdogResponseWrapper,
     DEFAULT_CHECK_INTERVAL,
     DEFAULT_MAX_SILENCE,
+    MIN_WAIT,
 )
 
 
+def recover(watchdog: SSEWatchdog, silence: float = 999) -> None:
+    """Trigger recovery and wait for its background threads to finish."""
+    watchdog._trigger_recovery(silence)
+    for thread in watchdog._recovery_threads:
+        thread.join(timeout=1)
+
+
 class TestWatchdogResponseWrapper(unittest.TestCase):
     def test_iterates_through_all_chunks(self) -> None:
         """Verify all chunks are yielded unchanged"""
@@ -28,11 +44,56 @@ class TestWatchdogResponseWrapper(unittest.TestCase):
         mock_response = iter(chunks)
         on_data_received: Mock = Mock()
 
-        wrapper = WatchdogResponseWrapper(mock_response, on_data_received)
-        list(wrapper)  # Consume the iterator
+        wrapper = WatchdogResponseWrapper(
+            mock_response, on_data_received, coalesce_ns=0
+        )
+        deque(wrapper, maxlen=0)  # Consume the iterator
 
         self.assertEqual(on_data_received.call_count, 3)
 
+    def test_coalesces_callback_within_window(self) -> None:
+        """Verify a burst of chunks only touches once per window"""
+        chunks = [b"chunk1", b"chunk2", b"chunk3"]
+        mock_response = iter(chunks)
+        on_data_received: Mock = Mock()
+
+        wrapper = WatchdogResponseWrapper(
+            mock_response, on_data_received, coalesce_ns=60 * 10**9
+        )
+        result = list(wrapper)
+
+        self.assertEqual(result, chunks)
+        self.assertEqual(on_data_received.call_count, 1)
+
+    @patch("sdk_reforge._sse_watchdog.time.monotonic_ns")
+    def test_coalesces_high_rate_stream(self, mock_time: Mock) -> None:
+        """Verify a steady high chunk rate touches once per window"""
+        # 1000 chunks arriving 1ms apart, after the timestamp taken in __init__
+        mock_time.side_effect = [0] + [i * 1_000_000 for i in range(1000)]
+        on_data_received: Mock = Mock()
+
+        wrapper = WatchdogResponseWrapper(
+            iter([b"x"] * 1000), on_data_received, coalesce_ns=100_000_000
+        )
+        deque(wrapper, maxlen=0)
+
+        self.assertEqual(on_data_received.call_count, 10)
+
+    def test_reads_raw_stream_with_read1(self) -> None:
+        """Verify a streamed urllib3 body is read directly rather than iterated"""
+        raw = HTTPResponse(
+            body=io.BytesIO(b": keepalive\n\ndata: abc\n\n"),
+            preload_content=False,
+        )
+        response = Response()
+        response.raw = raw
+        on_data_received: Mock = Mock()
+
+        wrapper = WatchdogResponseWrapper(response, on_data_received)
+
+        self.assertEqual(b"".join(wrapper), b": keepalive\n\ndata: abc\n\n")
+        on_data_received.assert_called_once()
+
     def test_close_delegates_to_response(self) -> None:
         """Verify close() is delegated to the wrapped response"""
         mock_response: Mock = Mock()
@@ -45,25 +106,36 @@ class TestWatchdogResponseWrapper(unittest.TestCase):
 
 
 class TestSSEWatchdog(unittest.TestCase):
+    config_client: Mock
+    poll_fallback_fn: Mock
+    get_sse_client_fn: Mock
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Built once and reset per test, which is cheaper than new Mocks
+        cls.config_client = Mock()
+        cls.poll_fallback_fn = Mock()
+        cls.get_sse_client_fn = Mock()
+
     def setUp(self) -> None:
-        self.config_client: Mock = Mock()
+        for mock in (self.config_client, self.poll_fallback_fn, self.get_sse_client_fn):
+            mock.reset_mock(return_value=True, side_effect=True)
         self.config_client.is_shutting_down.return_value = False
-        self.poll_fallback_fn: Mock = Mock()
-        self.get_sse_client_fn: Mock = Mock(return_value=None)
+        self.get_sse_client_fn.return_value = None
 
     def test_touch_updates_last_activity(self) -> None:
-        """Verify touch() updates the last_activity timestamp"""
+        """Verify touch() updates the last_activity_ns timestamp"""
         watchdog = SSEWatchdog(
             self.config_client,
             self.poll_fallback_fn,
             self.get_sse_client_fn,
         )
 
-        initial_time = watchdog.last_activity
-        time.sleep(0.01)  # Small delay to ensure time difference
+        # Backdate rather than sleep, so coarse monotonic clocks can't tie
+        initial_ns = watchdog.last_activity_ns = time.monotonic_ns() - 1
         watchdog.touch()
 
-        self.assertGreater(watchdog.last_activity, initial_time)
+        self.assertGreater(watchdog.last_activity_ns, initial_ns)
 
     def test_no_recovery_when_active(self) -> None:
         """Verify no recovery is triggered when activity is recent"""
@@ -79,23 +151,16 @@ class TestSSEWatchdog(unittest.TestCase):
         watchdog.touch()
 
         # Manually run the check logic
-        silence = time.time() - watchdog.last_activity
-        self.assertLess(silence, watchdog.max_silence)
+        self.assertLess(watchdog._silence(), watchdog.max_silence)
 
         # Poll should not have been called
         self.poll_fallback_fn.assert_not_called()
 
-    @patch("sdk_reforge._sse_watchdog.time.time")
+    @patch("sdk_reforge._sse_watchdog.time.monotonic_ns")
     def test_triggers_recovery_when_silent(self, mock_time: Mock) -> None:
         """Verify recovery is triggered after max_silence seconds"""
-        # Set up time mocking: initial time, then time during check
-        mock_time.side_effect = [
-            1000,  # Initial last_activity in __init__
-            1000,  # touch() call
-            1200,  # time check in _run (200s silence > 120s max)
-            1200,  # time in _trigger_recovery for logging
-            1200,  # reset last_activity after recovery
-        ]
+        # Each clock read advances 200 seconds, so extra reads can't exhaust it
+        mock_time.side_effect = count(1000 * 10**9, 200 * 10**9)
 
         watchdog = SSEWatchdog(
             self.config_client,
@@ -105,13 +170,27 @@ class TestSSEWatchdog(unittest.TestCase):
         )
         watchdog.touch()
 
-        # Manually trigger recovery check
-        silence = 1200 - watchdog.last_activity  # 200 seconds
-        if silence > watchdog.max_silence:
-            watchdog._trigger_recovery(silence)
+        # Manually trigger recovery check against the mocked clock
+        silence = watchdog._silence()
+        self.assertGreater(silence, watchdog.max_silence)
+        recover(watchdog, silence)
 
         self.poll_fallback_fn.assert_called_once()
 
+    def test_recovery_polls_from_highwater_mark(self) -> None:
+        """Verify the fallback poll asks only for configs past the highwater mark"""
+        self.config_client.highwater_mark.return_value = 42
+
+        watchdog = SSEWatchdog(
+            self.config_client,
+            self.poll_fallback_fn,
+            self.get_sse_client_fn,
+        )
+
+        recover(watchdog)
+
+        self.poll_fallback_fn.assert_called_once_with(42)
+
     def test_recovery_closes_sse_client(self) -> None:
         """Verify recovery attempts to close the SSE client"""
         mock_sse_client: Mock = Mock()
@@ -123,7 +202,7 @@ class TestSSEWatchdog(unittest.TestCase):
             self.get_sse_client_fn,
         )
 
-        watchdog._trigger_recovery(999)
+        recover(watchdog)
 
         mock_sse_client.close.assert_called_once()
 
@@ -138,7 +217,7 @@ class TestSSEWatchdog(unittest.TestCase):
         )
 
         # Should not raise
-        watchdog._trigger_recovery(999)
+        recover(watchdog)
 
         self.poll_fallback_fn.assert_called_once()
 
@@ -155,7 +234,7 @@ class TestSSEWatchdog(unittest.TestCase):
         )
 
         # Should not raise
-        watchdog._trigger_recovery(999)
+        recover(watchdog)
 
         # Should still try to close SSE client
         mock_sse_client.close.assert_called_once()
@@ -173,28 +252,86 @@ class TestSSEWatchdog(unittest.TestCase):
         )
 
         # Should not raise
-        watchdog._trigger_recovery(999)
+        recover(watchdog)
 
         self.poll_fallback_fn.assert_called_once()
 
-    def test_recovery_resets_last_activity(self) -> None:
-        """Verify last_activity is reset after recovery"""
+    def test_recovery_does_not_wait_for_stalled_close(self) -> None:
+        """Verify a stalled close doesn't block the check that triggered it"""
+        release = threading.Event()
+        mock_sse_client: Mock = Mock()
+        mock_sse_client.close.side_effect = lambda: release.wait(5)
+        self.get_sse_client_fn.return_value = mock_sse_client
+
         watchdog = SSEWatchdog(
             self.config_client,
             self.poll_fallback_fn,
             self.get_sse_client_fn,
         )
 
-        # Set last_activity to old time
-        watchdog.last_activity = time.time() - 1000
+        start = time.monotonic()
+        watchdog._trigger_recovery(999)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1)
+        self.assertTrue(all(t.daemon for t in watchdog._recovery_threads))
+        release.set()
+        # Don't let a late poll hit the shared mocks after the next setUp
+        for thread in watchdog._recovery_threads:
+            thread.join(timeout=1)
+
+    def test_recovery_skipped_while_previous_still_running(self) -> None:
+        """Verify a stalled recovery isn't piled on by the next one"""
+        release = threading.Event()
+        mock_sse_client: Mock = Mock()
+        mock_sse_client.close.side_effect = lambda: release.wait(5)
+        self.get_sse_client_fn.return_value = mock_sse_client
+
+        watchdog = SSEWatchdog(
+            self.config_client,
+            self.poll_fallback_fn,
+            self.get_sse_client_fn,
+        )
 
         watchdog._trigger_recovery(999)
+        watchdog._trigger_recovery(999)
+        release.set()
+        for thread in watchdog._recovery_threads:
+            thread.join(timeout=1)
 
-        # last_activity should be recent now
-        self.assertLess(time.time() - watchdog.last_activity, 1)
+        mock_sse_client.close.assert_called_once()
 
-    def test_stop_terminates_thread(self) -> None:
-        """Verify stop() terminates the watchdog thread"""
+    def test_recovery_after_stop_is_noop(self) -> None:
+        """Verify a recovery racing with stop() doesn't raise"""
+        watchdog = SSEWatchdog(
+            self.config_client,
+            self.poll_fallback_fn,
+            self.get_sse_client_fn,
+        )
+
+        watchdog.stop()
+        recover(watchdog)
+
+        self.poll_fallback_fn.assert_not_called()
+
+    def test_recovery_resets_last_activity(self) -> None:
+        """Verify last_activity_ns is reset after recovery"""
+        watchdog = SSEWatchdog(
+            self.config_client,
+            self.poll_fallback_fn,
+            self.get_sse_client_fn,
+        )
+
+        # Set last_activity_ns to old time
+        watchdog.last_activity_ns = time.monotonic_ns() - 1000 * 10**9
+
+        recover(watchdog)
+
+        # last_activity_ns should be recent now
+        self.assertLess(watchdog._silence(), 1)
+
+    def test_stop_unregisters_from_scheduler(self) -> None:
+        """Verify stop() removes the watchdog from the shared scheduler"""
         watchdog = SSEWatchdog(
             self.config_client,
             self.poll_fallback_fn,
@@ -203,11 +340,30 @@ class TestSSEWatchdog(unittest.TestCase):
         )
 
         watchdog.start()
-        assert watchdog._thread is not None
-        self.assertTrue(watchdog._thread.is_alive())
+        self.assertIn(watchdog, _SCHEDULER)
 
         watchdog.stop()
-        self.assertFalse(watchdog._thread.is_alive())
+        self.assertNotIn(watchdog, _SCHEDULER)
+
+    def test_watchdogs_share_one_thread(self) -> None:
+        """Verify several watchdogs are checked from a single scheduler thread"""
+        threads_before = threading.active_count()
+        watchdogs = [
+            SSEWatchdog(
+                self.config_client,
+                self.poll_fallback_fn,
+                self.get_sse_client_fn,
+                check_interval=1,
+            )
+            for _ in range(5)
+        ]
+
+        for watchdog in watchdogs:
+            watchdog.start()
+        self.assertLessEqual(threading.active_count(), threads_before + 1)
+
+        for watchdog in watchdogs:
+            watchdog.stop()
 
     def test_stop_before_start_is_noop(self) -> None:
         """Verify stop() is safe before the watchdog thread is started"""
@@ -223,22 +379,64 @@ class TestSSEWatchdog(unittest.TestCase):
 
     def test_stops_when_shutting_down(self) -> None:
         """Verify watchdog stops when config_client is shutting down"""
-        self.config_client.is_shutting_down.return_value = True
+        checked = threading.Event()
+
+        def is_shutting_down() -> bool:
+            checked.set()
+            return True
+
+        self.config_client.is_shutting_down.side_effect = is_shutting_down
 
         watchdog = SSEWatchdog(
             self.config_client,
             self.poll_fallback_fn,
             self.get_sse_client_fn,
-            check_interval=0.1,
+            check_interval=0.01,
         )
 
         watchdog.start()
-        time.sleep(0.3)  # Give it time to check
+        self.assertTrue(checked.wait(timeout=1))
 
         # Should have stopped on its own
+        self.assertNotIn(watchdog, _SCHEDULER)
         watchdog.stop()
         self.poll_fallback_fn.assert_not_called()
 
+    def test_next_wait_is_capped_by_silence_deadline(self) -> None:
+        """Verify the loop wakes at the silence deadline when it precedes the next check"""
+        watchdog = SSEWatchdog(
+            self.config_client,
+            self.poll_fallback_fn,
+            self.get_sse_client_fn,
+            check_interval=60,
+            max_silence=120,
+        )
+
+        watchdog.last_activity_ns = time.monotonic_ns() - 100 * 10**9
+        self.assertLessEqual(watchdog._next_wait(), 20)
+
+        watchdog.last_activity_ns = time.monotonic_ns() - 500 * 10**9
+        self.assertEqual(watchdog._next_wait(), MIN_WAIT)
+
+        watchdog.touch()
+        self.assertEqual(watchdog._next_wait(), 60)
+
+    def test_default_wait_runs_to_silence_deadline(self) -> None:
+        """Verify a freshly touched watchdog sleeps for the whole silence window"""
+        watchdog = SSEWatchdog(
+            self.config_client,
+            self.poll_fallback_fn,
+            self.get_sse_client_fn,
+        )
+
+        watchdog.touch()
+        self.assertAlmostEqual(watchdog._next_wait(), DEFAULT_MAX_SILENCE, delta=1)
+
+        watchdog.last_activity_ns -= 100 * 10**9
+        self.assertAlmostEqual(
+            watchdog._next_wait(), DEFAULT_MAX_SILENCE - 100, delta=1
+        )
+
     def test_default_values(self) -> None:
         """Verify default configuration values"""
         watchdog = SSEWatchdog(
@@ -258,7 +456,8 @@ class TestSSEWatchdogIntegration(unittest.TestCase):
         """Integration test: watchdog fires recovery after silence period"""
         config_client: Mock = Mock()
         config_client.is_shutting_down.return_value = False
-        poll_fallback_fn: Mock = Mock()
+        fired = threading.Event()
+        poll_fallback_fn: Mock = Mock(side_effect=lambda *args: fired.set())
         get_sse_client_fn: Mock = Mock(return_value=None)
 
         # Use short intervals for testing
@@ -266,45 +465,90 @@ class TestSSEWatchdogIntegration(unittest.TestCase):
             config_client,
             poll_fallback_fn,
             get_sse_client_fn,
-            check_interval=0.1,  # Check every 100ms
-            max_silence=0.2,  # Fire after 200ms of silence
+            check_interval=0.02,  # Check every 20ms
+            max_silence=0.05,  # Fire after 50ms of silence
         )
 
         watchdog.start()
 
-        # Wait for silence period + check interval
-        time.sleep(0.5)
+        # Recovery should be triggered once the silence period has passed
+        self.assertTrue(fired.wait(timeout=1))
 
         watchdog.stop()
 
-        # Recovery should have been triggered
-        self.assertTrue(poll_fallback_fn.called)
+    def test_stalled_recovery_does_not_delay_other_watchdogs(self) -> None:
+        """Integration test: one watchdog's stalled close doesn't hold up another"""
+        config_client: Mock = Mock()
+        config_client.is_shutting_down.return_value = False
+        closing = threading.Event()
+        release = threading.Event()
+
+        def stalled_close() -> None:
+            closing.set()
+            release.wait(5)
+
+        stalled_sse_client: Mock = Mock()
+        stalled_sse_client.close.side_effect = stalled_close
+        stalled = SSEWatchdog(
+            config_client,
+            Mock(),
+            Mock(return_value=stalled_sse_client),
+            check_interval=0.02,
+            max_silence=0.05,
+        )
+        stalled.start()
+        self.assertTrue(closing.wait(timeout=1))
+
+        fired = threading.Event()
+        other = SSEWatchdog(
+            config_client,
+            Mock(side_effect=lambda *args: fired.set()),
+            Mock(return_value=None),
+            check_interval=0.02,
+            max_silence=0.05,
+        )
+        other.start()
+
+        try:
+            self.assertTrue(fired.wait(timeout=1))
+        finally:
+            release.set()
+            stalled.stop()
+            other.stop()
 
     def test_watchdog_does_not_fire_with_activity(self) -> None:
         """Integration test: watchdog does not fire when touched regularly"""
         config_client: Mock = Mock()
         config_client.is_shutting_down.return_value = False
-        poll_fallback_fn: Mock = Mock()
+        fired = threading.Event()
+        poll_fallback_fn: Mock = Mock(side_effect=lambda *args: fired.set())
         get_sse_client_fn: Mock = Mock(return_value=None)
 
         watchdog = SSEWatchdog(
             config_client,
             poll_fallback_fn,
             get_sse_client_fn,
-            check_interval=0.1,
-            max_silence=0.3,
+            check_interval=0.02,
+            max_silence=0.1,
         )
 
+        # Keep touching to simulate activity until the test is done
+        done = threading.Event()
+
+        def keep_touching() -> None:
+            while not done.wait(0.005):
+                watchdog.touch()
+
+        toucher = threading.Thread(target=keep_touching, daemon=True)
+        toucher.start()
         watchdog.start()
 
-        # Keep touching to simulate activity
-        for _ in range(5):
-            watchdog.touch()
-            time.sleep(0.1)
+        # Recovery should NOT be triggered across several silence windows
+        self.assertFalse(fired.wait(timeout=0.3))
 
+        done.set()
+        toucher.join()
         watchdog.stop()
-
-        # Recovery should NOT have been triggered
         poll_fallback_fn.assert_not_called()
 
 
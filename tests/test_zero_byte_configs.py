@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import base64
+from types import SimpleNamespace
 
+from sdk_reforge import Options
 from sdk_reforge.config_sdk import ConfigSDK
 from sdk_reforge._sse_connection_manager import SSEConnectionManager
 import prefab_pb2 as Prefab
 
+# ConfigSDK only reads .options from its base client in these tests
+_LOCAL_OPTIONS = Options(reforge_datasources="LOCAL_ONLY", collect_sync_interval=None)
+
 
 class TestZeroByteConfigHandling(unittest.TestCase):
     @patch("sdk_reforge.config_sdk.logger")
@@ -21,9 +25,7 @@ class TestZeroByteConfigHandling(unittest.TestCase):
         mock_api_client.resilient_request.return_value = mock_response
 
         # Create ConfigSDK with mocked dependencies
-        options = Mock()
-        options.api_key = "test_key"
-        config_sdk = ConfigSDK(options)
+        config_sdk = ConfigSDK(SimpleNamespace(options=_LOCAL_OPTIONS))
         config_sdk.api_client = mock_api_client
         config_sdk.config_loader = Mock()
         config_sdk.config_loader.highwater_mark = 123
@@ -54,9 +56,7 @@ class TestZeroByteConfigHandling(unittest.TestCase):
         mock_api_client.resilient_request.return_value = mock_response
 
         # Create ConfigSDK with mocked dependencies
-        options = Mock()
-        options.api_key = "test_key"
-        config_sdk = ConfigSDK(options)
+        config_sdk = ConfigSDK(SimpleNamespace(options=_LOCAL_OPTIONS))
         config_sdk.api_client = mock_api_client
         config_sdk.config_loader = Mock()
         config_sdk.config_loader.highwater_mark = 123
@@ -137,11 +137,10 @@ class TestZeroByteConfigHandling(unittest.TestCase):
         configs = Prefab.Configs()
         config = configs.configs.add()
         config.key = "test_key"
-        valid_content = configs.SerializeToString()
 
-        # Mock SSE event with valid payload
+        # Decoding is patched below, so the event payload only has to be non-empty
         mock_event = Mock()
-        mock_event.data = base64.b64encode(valid_content).decode("utf-8")
+        mock_event.data = "dummy"
 
         mock_sse_client = Mock()
         mock_sse_client.events.return_value = iter([mock_event])
@@ -154,6 +153,9 @@ class TestZeroByteConfigHandling(unittest.TestCase):
             return_value=mock_sse_client,
         ):
             with patch(
+                "sdk_reforge._sse_connection_manager.base64.b64decode",
+                return_value=b"\x00",
+            ), patch(
                 "sdk_reforge._sse_connection_manager.Prefab.Configs.FromString"
             ) as mock_from_string:
                 mock_from_string.return_value = configs
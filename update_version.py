@@ -13,46 +13,64 @@ import re
 import sys
 from pathlib import Path
 
+# \Z rather than $ so a trailing newline isn't accepted as part of a version
+_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9\-\.]+)?\Z")
+_TOML_VERSION_RE = re.compile(r'^version = "[^"]*"$', re.MULTILINE)
+
+# resolve() so the paths hold when the script is run through a symlink
+_ROOT = Path(__file__).resolve().parent
+_VERSION_FILE = _ROOT / "sdk_reforge" / "VERSION"
+_TOML_FILE = _ROOT / "pyproject.toml"
+
 
 def get_current_version():
     """Get current version from VERSION file."""
-    version_file = Path(__file__).parent / "sdk_reforge" / "VERSION"
     try:
-        return version_file.read_text().strip()
+        return _VERSION_FILE.read_text(encoding="utf-8").strip()
     except FileNotFoundError:
         return "unknown"
 
 
-def update_version_file(new_version: str):
-    """Update the VERSION file."""
-    version_file = Path(__file__).parent / "sdk_reforge" / "VERSION"
-    version_file.write_text(new_version + "\n")
-    print(f"✓ Updated {version_file}")
+def _read_and_update_version(new_version: str) -> str:
+    """Update the VERSION file and return the version it held before."""
+    try:
+        with _VERSION_FILE.open("r+", encoding="utf-8") as f:
+            current = f.read().strip()
+            if current != new_version:
+                f.seek(0)
+                f.write(new_version + "\n")
+                f.truncate()
+    except FileNotFoundError:
+        current = "unknown"
+        _VERSION_FILE.write_text(new_version + "\n", encoding="utf-8")
+    return current
 
 
 def update_pyproject_toml(new_version: str):
     """Update the version in pyproject.toml."""
-    toml_file = Path(__file__).parent / "pyproject.toml"
-    content = toml_file.read_text()
+    content = _TOML_FILE.read_text()
+    version_line = f'version = "{new_version}"'
+
+    match = _TOML_VERSION_RE.search(content)
+    if match and match.group(0) == version_line:
+        print(f"= {_TOML_FILE} already at target version")
+        return True
 
     # Update version line
-    updated_content = re.sub(
-        r'^version = ".*"$', f'version = "{new_version}"', content, flags=re.MULTILINE
-    )
+    updated_content = _TOML_VERSION_RE.sub(version_line, content)
 
     if content == updated_content:
-        print(f"⚠ No version found in {toml_file}")
+        print(f"⚠ No version found in {_TOML_FILE}")
         return False
 
-    toml_file.write_text(updated_content)
-    print(f"✓ Updated {toml_file}")
+    _TOML_FILE.write_text(updated_content)
+    print(f"✓ Updated {_TOML_FILE}")
     return True
 
 
 def validate_version(version: str) -> bool:
     """Validate version format (semantic versioning)."""
-    pattern = r"^\d+\.\d+\.\d+(-[a-zA-Z0-9\-\.]+)?$"
-    return bool(re.match(pattern, version))
+    return bool(_VERSION_RE.match(version))
 
 
 def main():
@@ -79,11 +97,13 @@ def main():
         print("Expected format: MAJOR.MINOR.PATCH (e.g., 0.13.0)")
         sys.exit(1)
 
-    current = get_current_version()
-    print(f"Updating version: {current} → {new_version}")
-
     try:
-        update_version_file(new_version)
+        current = _read_and_update_version(new_version)
+        print(f"Updating version: {current} → {new_version}")
+        if current == new_version:
+            print(f"= {_VERSION_FILE} already at target version")
+        else:
+            print(f"✓ Updated {_VERSION_FILE}")
         update_pyproject_toml(new_version)
         print(f"\n✅ Successfully updated to version {new_version}")
         print("\nDon't forget to:")